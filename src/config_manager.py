@@ -26,14 +26,33 @@ Phase: 4 - Configuration Management
 
 import yaml
 import re
+import os
+import copy
+import json
+from collections import OrderedDict
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional
-import tempfile
-import shutil
 import logging
 
+# Module-level alias so tests can fail this module's file I/O without
+# patching builtins.open for everything else
+from builtins import open as _open
+from src.yaml_io import yaml_load, yaml_dump
+
 logger = logging.getLogger(__name__)
 
+# Parsed config files keyed by (absolute path, st_mtime_ns, st_size); a
+# changed file gets a new key, so stale entries simply age out
+_YAML_CACHE: OrderedDict = OrderedDict()
+_YAML_CACHE_SIZE = 32
+
+# Suffix of the JSON sidecar that caches a parsed config across runs
+_SIDECAR_SUFFIX = ".cache"
+
+# Sentinel for "key not present" (None is a valid config value)
+_MISSING = object()
+
 
 class ConfigManager:
     """
@@ -44,20 +63,23 @@ class ConfigManager:
     Merges partial configs with defaults.
     """
 
-    # Default configuration values (all 11 settings)
-    DEFAULT_CONFIG = {
-        "hotkey": "ctrl+shift+space",
-        "snippet_file": str(Path.home() / "snippets" / "snippets.yaml"),
-        "max_results": 10,
-        "overlay_opacity": 0.95,
-        "theme": "dark",
-        "fuzzy_threshold": 60,
-        "search_debounce_ms": 150,
-        "auto_reload": True,
-        "run_on_startup": False,
-        "overlay_width": 600,
-        "overlay_height": 400,
-    }
+    # Default configuration values (all 11 settings); read-only, use
+    # .copy() for a mutable dict
+    DEFAULT_CONFIG = MappingProxyType(
+        {
+            "hotkey": "ctrl+shift+space",
+            "snippet_file": str(Path.home() / "snippets" / "snippets.yaml"),
+            "max_results": 10,
+            "overlay_opacity": 0.95,
+            "theme": "dark",
+            "fuzzy_threshold": 60,
+            "search_debounce_ms": 150,
+            "auto_reload": True,
+            "run_on_startup": False,
+            "overlay_width": 600,
+            "overlay_height": 400,
+        }
+    )
 
     # Validation ranges for numeric settings
     VALIDATION_RANGES = {
@@ -70,11 +92,13 @@ class ConfigManager:
     }
 
     # Valid theme options
-    VALID_THEMES = {"dark", "light", "system"}
+    VALID_THEMES = frozenset({"dark", "light", "system"})
 
-    # Hotkey validation pattern
+    # Hotkey validation pattern (used with fullmatch; non-capturing groups
+    # since only the match result is needed)
     HOTKEY_PATTERN = re.compile(
-        r"^(ctrl|shift|alt)(\+(ctrl|shift|alt))*\+([a-z0-9]+|space|enter|f\d{1,2})$",
+        r"(?:ctrl|shift|alt)(?:\+(?:ctrl|shift|alt))*"
+        r"\+(?:[a-z0-9]+|space|enter|f\d{1,2})",
         re.IGNORECASE,
     )
 
@@ -99,6 +123,18 @@ class ConfigManager:
         else:
             self.config_path = Path(config_path)
 
+        # Parse-cache key of the file this config was loaded from
+        self._cache_key: Optional[tuple] = None
+        # True once set() changed a value that has not been saved yet
+        self._dirty = False
+        # Contents as last loaded or saved; save() compares against it to
+        # catch changes made directly on self.config. None while the file
+        # does not hold them (unreadable, malformed, or not yet written)
+        self._saved: Optional[dict[str, Any]] = None
+        # Config contents validate() last checked, with its result; reused
+        # while the config still equals them
+        self._validated: Optional[tuple[dict[str, Any], bool, list[str]]] = None
+
         # Load configuration
         self.config = self._load_config()
 
@@ -109,6 +145,11 @@ class ConfigManager:
         Returns:
             Configuration dictionary merged with defaults
 
+        Parsed files are cached by path, mtime and size, so constructing
+        several managers for an unchanged file parses it only once. The
+        parse is also kept in a JSON sidecar next to the file, so later
+        runs skip the YAML parser until the file changes.
+
         Handles:
             - Missing config file (creates default)
             - Malformed YAML (falls back to defaults)
@@ -121,11 +162,31 @@ class ConfigManager:
             return self._create_default_config()
 
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                loaded_config = yaml.safe_load(f) or {}
+            st = os.stat(self.config_path)
+            cache_key = (os.path.abspath(self.config_path), st.st_mtime_ns, st.st_size)
+            self._cache_key = cache_key
+            cached = _YAML_CACHE.get(cache_key)
+            if cached is not None:
+                _YAML_CACHE.move_to_end(cache_key)
+                # Deep copy so set() on this manager can't alter the cache
+                loaded_config = copy.deepcopy(cached)
+            elif st.st_size == 0:
+                loaded_config = {}
+            else:
+                loaded_config = self._read_sidecar(st)
+                if loaded_config is None:
+                    # One read() into bytes; libyaml decodes the UTF-8 itself
+                    with _open(self.config_path, "rb") as f:
+                        loaded_config = yaml_load(f.read()) or {}
+                    self._write_sidecar(st, loaded_config)
+
+                _YAML_CACHE[cache_key] = copy.deepcopy(loaded_config)
+                if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+                    _YAML_CACHE.popitem(last=False)
 
             # Merge with defaults (defaults provide missing values)
             merged_config = self._merge_with_defaults(loaded_config)
+            self._saved = copy.deepcopy(merged_config)
 
             logger.info(f"Loaded config from {self.config_path}")
             return merged_config
@@ -137,6 +198,61 @@ class ConfigManager:
             logger.error(f"Error loading config: {e}, using defaults")
             return self.DEFAULT_CONFIG.copy()
 
+    def _sidecar_path(self) -> Path:
+        """Return the path of the JSON parse cache for this config file."""
+        return self.config_path.with_name(self.config_path.name + _SIDECAR_SUFFIX)
+
+    def _read_sidecar(self, st: os.stat_result) -> Optional[dict[str, Any]]:
+        """
+        Load the cached parse if it was taken from the file as it is now.
+
+        Args:
+            st: Current stat of the config file
+
+        Returns:
+            Cached configuration, or None if missing, stale or unreadable
+        """
+        try:
+            with _open(self._sidecar_path(), "rb") as f:
+                sidecar = json.loads(f.read())
+            if (
+                sidecar["mtime_ns"] == st.st_mtime_ns
+                and sidecar["size"] == st.st_size
+                and isinstance(sidecar["config"], dict)
+            ):
+                return sidecar["config"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _write_sidecar(self, st: os.stat_result, loaded_config: Any) -> None:
+        """
+        Cache a parsed config as JSON; silently skipped when not possible.
+
+        Only written when JSON reproduces the parse exactly (e.g. YAML dates
+        or non-string keys would not survive), and never fails the load.
+
+        Args:
+            st: Stat of the config file the parse came from
+            loaded_config: Parsed YAML document
+        """
+        if not isinstance(loaded_config, dict):
+            return
+        try:
+            payload = json.dumps(
+                {
+                    "mtime_ns": st.st_mtime_ns,
+                    "size": st.st_size,
+                    "config": loaded_config,
+                }
+            )
+            if json.loads(payload)["config"] != loaded_config:
+                return
+            with _open(self._sidecar_path(), "w", encoding="utf-8") as f:
+                f.write(payload)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Config parse cache not written: {e}")
+
     def _create_default_config(self) -> dict[str, Any]:
         """
         Create default config file and return default configuration.
@@ -149,10 +265,14 @@ class ConfigManager:
 
         # Write default config to file
         try:
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                yaml.dump(
-                    self.DEFAULT_CONFIG, f, default_flow_style=False, sort_keys=False
+            with _open(self.config_path, "w", encoding="utf-8") as f:
+                yaml_dump(
+                    dict(self.DEFAULT_CONFIG),
+                    f,
+                    default_flow_style=False,
+                    sort_keys=False,
                 )
+            self._saved = copy.deepcopy(dict(self.DEFAULT_CONFIG))
             logger.info(f"Created default config at {self.config_path}")
         except Exception as e:
             logger.error(f"Failed to create default config: {e}")
@@ -169,13 +289,8 @@ class ConfigManager:
         Returns:
             Merged configuration with all required keys
         """
-        # Start with defaults
-        merged = self.DEFAULT_CONFIG.copy()
-
-        # Update with loaded values (overrides defaults)
-        merged.update(loaded_config)
-
-        return merged
+        # Loaded values override defaults; the merge runs in C in one step
+        return self.DEFAULT_CONFIG | loaded_config
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -200,34 +315,51 @@ class ConfigManager:
 
         Note: Does not automatically save to disk. Call save() to persist.
         """
+        current = self.config.get(key, _MISSING)
+        # Compare types too, so e.g. True -> 1 still counts as a change
+        if current == value and type(current) is type(value):
+            return
         self.config[key] = value
+        self._dirty = True
 
     def save(self) -> None:
         """
         Save current configuration to disk atomically.
 
         Uses atomic write pattern (write to temp file, then rename)
-        to prevent corruption if write fails.
+        to prevent corruption if write fails. The YAML is serialized in
+        memory first and written to the temp file in one call. Does nothing
+        when no value has changed since the config was loaded or last saved,
+        whether through set() or by editing self.config directly, and the
+        config file still exists.
         """
+        if not self._dirty and self.config == self._saved and self.config_path.exists():
+            return
+
         try:
             # Ensure parent directory exists
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write to temporary file first (atomic write pattern)
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                encoding="utf-8",
-                dir=self.config_path.parent,
-                delete=False,
-                suffix=".yaml",
-            ) as tmp_file:
-                yaml.dump(
-                    self.config, tmp_file, default_flow_style=False, sort_keys=False
-                )
-                tmp_path = Path(tmp_file.name)
-
-            # Atomic rename (replaces existing file)
-            shutil.move(str(tmp_path), str(self.config_path))
+            payload = yaml_dump(
+                self.config, default_flow_style=False, sort_keys=False
+            ).encode("utf-8")
+
+            # Write to temporary file first, then atomically replace the config
+            tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+            try:
+                with _open(tmp_path, "wb") as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.config_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+            # The parse cached for the old file contents is stale now
+            _YAML_CACHE.pop(self._cache_key, None)
+            self._dirty = False
+            self._saved = copy.deepcopy(self.config)
 
             logger.info(f"Saved config to {self.config_path}")
 
@@ -239,9 +371,16 @@ class ConfigManager:
         """
         Validate current configuration.
 
+        The result is cached until the config contents change, whether
+        through set() or by editing self.config directly.
+
         Returns:
             Tuple of (is_valid, list_of_error_messages)
         """
+        if self._validated is not None and self._validated[0] == self.config:
+            _, is_valid, errors = self._validated
+            return (is_valid, list(errors))
+
         errors = []
 
         # Validate hotkey format
@@ -256,23 +395,28 @@ class ConfigManager:
         )
         errors.extend(path_errors)
 
-        # Validate numeric ranges
+        # Validate numeric settings: type and range in one pass over the table
+        config = self.config
         for field, (min_val, max_val) in self.VALIDATION_RANGES.items():
-            value = self.config.get(field)
-            if value is not None:
-                range_valid, range_errors = self._validate_range(
-                    field, value, min_val, max_val
+            value = config.get(field)
+            if value is None:
+                continue
+            if not isinstance(value, (int, float)):
+                errors.append(f"{field} must be numeric, got {type(value).__name__}")
+            elif not min_val <= value <= max_val:
+                errors.append(
+                    f"{field} value {value} out of range [{min_val}, {max_val}]"
                 )
-                errors.extend(range_errors)
 
         # Validate theme
         theme = self.config.get("theme", "")
         if theme not in self.VALID_THEMES:
             errors.append(
-                f"Invalid theme '{theme}', must be one of: {', '.join(self.VALID_THEMES)}"
+                f"Invalid theme '{theme}', must be one of: {', '.join(sorted(self.VALID_THEMES))}"
             )
 
-        return (len(errors) == 0, errors)
+        self._validated = (copy.deepcopy(config), len(errors) == 0, errors)
+        return (len(errors) == 0, list(errors))
 
     def _validate_hotkey(self, hotkey: str) -> tuple[bool, list[str]]:
         """
@@ -301,14 +445,13 @@ class ConfigManager:
             return (False, errors)
 
         # Check pattern match
-        if not self.HOTKEY_PATTERN.match(hotkey):
+        if not self.HOTKEY_PATTERN.fullmatch(hotkey):
             errors.append(f"Invalid hotkey format: '{hotkey}'")
             errors.append("Format: (ctrl|shift|alt)+...+key")
             return (False, errors)
 
-        # Check for duplicate modifiers
-        parts = hotkey.lower().split("+")
-        modifiers = parts[:-1]  # All parts except the last (key)
+        # Check for duplicate modifiers (the regex can't express uniqueness)
+        modifiers = hotkey.lower().split("+")[:-1]  # All parts except the key
 
         if len(modifiers) != len(set(modifiers)):
             errors.append(f"Duplicate modifiers in hotkey: '{hotkey}'")
@@ -320,52 +463,16 @@ class ConfigManager:
         """
         Validate snippet file path.
 
-        Args:
-            path: File path to validate
-
-        Returns:
-            Tuple of (is_valid, list_of_error_messages)
-        """
-        errors = []
-
-        if not path or not path.strip():
-            errors.append("Snippet file path cannot be empty")
-            return (False, errors)
-
-        # Just check it's a valid path format (doesn't need to exist yet)
-        try:
-            Path(path)
-        except Exception as e:
-            errors.append(f"Invalid file path format: {e}")
-            return (False, errors)
-
-        return (True, [])
-
-    def _validate_range(
-        self, field: str, value: Any, min_val: float, max_val: float
-    ) -> tuple[bool, list[str]]:
-        """
-        Validate numeric value is within allowed range.
+        Only the value itself is checked; the file need not exist yet and
+        the filesystem is never touched (a missing file is handled at load).
 
         Args:
-            field: Field name
-            value: Value to validate
-            min_val: Minimum allowed value
-            max_val: Maximum allowed value
+            path: File path to validate
 
         Returns:
             Tuple of (is_valid, list_of_error_messages)
         """
-        errors = []
-
-        # Check type
-        if not isinstance(value, (int, float)):
-            errors.append(f"{field} must be numeric, got {type(value).__name__}")
-            return (False, errors)
-
-        # Check range
-        if value < min_val or value > max_val:
-            errors.append(f"{field} value {value} out of range [{min_val}, {max_val}]")
-            return (False, errors)
+        if not (isinstance(path, str) and path.strip()):
+            return (False, ["Snippet file path cannot be empty"])
 
         return (True, [])
@@ -7,6 +7,9 @@ with filtering capabilities.
 Classes:
     SnippetCheckboxItem: QWidget for snippet with checkbox
     DeleteSnippetsDialog: Main deletion dialog
+
+Functions:
+    snippet_matches_filter: Filter matching used by the dialog (no Qt needed)
 """
 
 from PySide6.QtWidgets import (
@@ -28,6 +31,38 @@ from typing import List
 from src.snippet_manager import Snippet
 
 
+def _filter_haystack(snippet: Snippet) -> str:
+    """
+    Build the lowercased text a filter is matched against.
+
+    Fields are newline-separated so a (single-line) filter can't match
+    across two of them. Missing description or tags count as empty.
+    """
+    return "\n".join(
+        [
+            snippet.name,
+            snippet.description or "",
+            *(snippet.tags or ()),
+            snippet.content,
+        ]
+    ).lower()
+
+
+def snippet_matches_filter(snippet: Snippet, filter_text: str) -> bool:
+    """
+    Check if a snippet's name, description, tags or content contains the
+    filter text (case-insensitive).
+
+    Args:
+        snippet: Snippet to test
+        filter_text: Text typed into the filter box
+
+    Returns:
+        True if any field contains filter_text
+    """
+    return filter_text.lower() in _filter_haystack(snippet)
+
+
 class SnippetCheckboxItem(QWidget):
     """
     Widget representing a single snippet with checkbox.
@@ -42,6 +77,8 @@ class SnippetCheckboxItem(QWidget):
     def __init__(self, snippet: Snippet, parent=None):
         super().__init__(parent)
         self.snippet = snippet
+        # Lowercased searchable text, built once instead of per keystroke
+        self._filter_haystack = _filter_haystack(snippet)
         self.checkbox = QCheckBox()
         self._setup_ui()
 
@@ -82,14 +119,8 @@ class SnippetCheckboxItem(QWidget):
         self.checkbox.setChecked(checked)
 
     def matches_filter(self, filter_text: str) -> bool:
-        """Check if snippet matches filter text."""
-        filter_lower = filter_text.lower()
-        return (
-            filter_lower in self.snippet.name.lower()
-            or filter_lower in self.snippet.description.lower()
-            or any(filter_lower in tag.lower() for tag in self.snippet.tags)
-            or filter_lower in self.snippet.content.lower()
-        )
+        """Check if snippet matches filter text (see snippet_matches_filter)."""
+        return filter_text.lower() in self._filter_haystack
 
 
 class DeleteSnippetsDialog(QDialog):
@@ -275,12 +306,14 @@ class DeleteSnippetsDialog(QDialog):
         """Apply filter to snippet list."""
         self.filter_text = text
 
-        # Show/hide items based on filter
-        for item in self.snippet_items:
-            if not text or item.matches_filter(text):
-                item.show()
-            else:
-                item.hide()
+        # Show/hide items based on filter, suspending repaints so the list
+        # relayouts once at the end
+        self.snippet_container.setUpdatesEnabled(False)
+        try:
+            for item in self.snippet_items:
+                item.setVisible(not text or item.matches_filter(text))
+        finally:
+            self.snippet_container.setUpdatesEnabled(True)
 
         self._update_selection_count()
 
@@ -289,8 +322,12 @@ class DeleteSnippetsDialog(QDialog):
         self.filter_input.clear()
         self.filter_text = ""
 
-        for item in self.snippet_items:
-            item.show()
+        self.snippet_container.setUpdatesEnabled(False)
+        try:
+            for item in self.snippet_items:
+                item.show()
+        finally:
+            self.snippet_container.setUpdatesEnabled(True)
 
         self._update_selection_count()
 
@@ -298,10 +335,17 @@ class DeleteSnippetsDialog(QDialog):
         """Handle Select All checkbox change."""
         checked = state == Qt.CheckState.Checked.value
 
-        # Toggle all visible items
-        for item in self.snippet_items:
-            if item.isVisible():
-                item.set_checked(checked)
+        # Toggle all visible items; per-item signals are blocked so the
+        # selection count is recomputed once instead of once per item
+        self.snippet_container.setUpdatesEnabled(False)
+        try:
+            for item in self.snippet_items:
+                if item.isVisible():
+                    item.checkbox.blockSignals(True)
+                    item.set_checked(checked)
+                    item.checkbox.blockSignals(False)
+        finally:
+            self.snippet_container.setUpdatesEnabled(True)
 
         self._update_selection_count()
 
@@ -7,7 +7,7 @@ tag autocomplete in the snippet editor dialog.
 
 from PySide6.QtWidgets import QCompleter
 from PySide6.QtCore import Qt, QStringListModel
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 from typing import List
 
 
@@ -24,6 +24,10 @@ class FuzzyTagCompleter(QCompleter):
         """
         super().__init__(tags, parent)
         self.tags = tags
+        # Alphabetical order lets splitPath stop after the first 10 prefix hits
+        self._sorted_tags = sorted(tags)
+        # Lowercased once here rather than on every keystroke
+        self._lower_tags = [tag.lower() for tag in self._sorted_tags]
         self.score_cutoff = (
             60  # Threshold for fuzzy matching (same as search engine)
         )
@@ -58,31 +62,42 @@ class FuzzyTagCompleter(QCompleter):
             return []
 
         # Get fuzzy matches with scores
+        prefix_hits = []
         matches = []
+        fuzzy_candidates = {}
         match_lower = match_text.lower().strip()
 
-        for tag in self.tags:
-            tag_lower = tag.lower()
-
-            # Boost score for exact prefix matches
+        for i, tag_lower in enumerate(self._lower_tags):
+            # Exact prefix matches score 100; tags are visited alphabetically,
+            # so the first 10 prefix hits are already the final top 10
             if tag_lower.startswith(match_lower):
-                score = 100  # Perfect prefix match
+                prefix_hits.append(self._sorted_tags[i])
+                if len(prefix_hits) >= 10:
+                    return prefix_hits
             elif match_lower in tag_lower:
                 # Substring match gets high score
-                score = 90
+                matches.append((self._sorted_tags[i], 90))
             else:
-                # Use ratio for fuzzy matching (more strict than partial_ratio)
-                score = fuzz.ratio(match_lower, tag_lower)
-
-            if score >= self.score_cutoff:
-                matches.append((tag, score))
-
-        # Sort by score (descending), then alphabetically
+                fuzzy_candidates[i] = tag_lower
+
+        # Score the rest in one rapidfuzz call; ratio is more strict than
+        # partial_ratio
+        for _, score, i in process.extract(
+            match_lower,
+            fuzzy_candidates,
+            scorer=fuzz.ratio,
+            score_cutoff=self.score_cutoff,
+            limit=None,
+        ):
+            matches.append((self._sorted_tags[i], score))
+
+        # Sort remaining matches by score (descending), then alphabetically
         matches.sort(key=lambda x: (-x[1], x[0]))
 
         # Return top 10 matches (limit suggestions)
         # Return empty list if no matches (tests expect this)
-        return [tag for tag, score in matches[:10]]
+        remaining = 10 - len(prefix_hits)
+        return prefix_hits + [tag for tag, score in matches[:remaining]]
 
     def set_current_tag_prefix(self, prefix: str):
         """
@@ -104,6 +119,8 @@ class FuzzyTagCompleter(QCompleter):
             tags: New list of existing tags
         """
         self.tags = tags
+        self._sorted_tags = sorted(tags)
+        self._lower_tags = [tag.lower() for tag in self._sorted_tags]
 
         # Update the completer's model
         self.setModel(QStringListModel(tags))
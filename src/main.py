@@ -168,7 +168,7 @@ def main():
 
         # Initialize usage tracker
         usage_stats_file = os.path.join(
-            os.path.dirname(config_manager.get("snippet_file")), "usage_stats.yaml"
+            os.path.dirname(config_manager.get("snippet_file")), "usage_stats.json"
         )
         usage_tracker = UsageTracker(usage_stats_file)
 
@@ -25,13 +25,12 @@ from PySide6.QtWidgets import (
     QApplication,
     QPushButton,
     QMenu,
+    QDialog,
 )
 from PySide6.QtCore import Qt, QTimer, QCoreApplication
 from PySide6.QtGui import QCursor, QKeyEvent
 import pyperclip
 
-from src.variable_prompt_dialog import prompt_for_variables
-
 
 class OverlayWindow(QWidget):
     """
@@ -339,6 +338,21 @@ class OverlayWindow(QWidget):
 
     def _update_results(self, query):
         """Update results list based on search query."""
+        # Suspend repaints/signals while repopulating (one view update at the end)
+        self.results_list.setUpdatesEnabled(False)
+        self.results_list.blockSignals(True)
+        try:
+            self._populate_results(query)
+        finally:
+            self.results_list.blockSignals(False)
+            self.results_list.setUpdatesEnabled(True)
+
+        # Select first result
+        if self.results_list.count() > 0:
+            self.results_list.setCurrentRow(0)
+
+    def _populate_results(self, query):
+        """Fill the results list with snippets matching the search query."""
         self.results_list.clear()
 
         max_results = self.config.get("max_results", 10)
@@ -396,10 +410,6 @@ class OverlayWindow(QWidget):
                 item.setData(Qt.ItemDataRole.UserRole, snippet)  # Store snippet object
                 self.results_list.addItem(item)
 
-        # Select first result
-        if self.results_list.count() > 0:
-            self.results_list.setCurrentRow(0)
-
     def keyPressEvent(self, event: QKeyEvent):
         """Handle keyboard events (Ctrl+N, Ctrl+D, Enter, ESC, arrows)."""
         # Ctrl+N to add new snippet
@@ -482,7 +492,9 @@ class OverlayWindow(QWidget):
         variables = self.variable_handler.detect_variables(content)
 
         if variables:
-            # Show sequential prompts
+            from src.variable_prompt_dialog import prompt_for_variables
+
+            # Prompt for all variables in one dialog
             values = prompt_for_variables(variables, parent=self)
             if values is None:
                 # User cancelled, return to overlay without closing
@@ -518,7 +530,6 @@ class OverlayWindow(QWidget):
     def _on_add_snippet_clicked(self):
         """Open the Add Snippet dialog."""
         from src.snippet_editor_dialog import SnippetEditorDialog
-        from PySide6.QtWidgets import QDialog
 
         # Mark dialog as open (prevents hotkey toggle)
         self.dialog_open = True
@@ -559,7 +570,6 @@ class OverlayWindow(QWidget):
     def _on_edit_snippet_clicked(self):
         """Open the Edit Snippet dialog for the currently selected snippet."""
         from src.snippet_editor_dialog import SnippetEditorDialog
-        from PySide6.QtWidgets import QDialog
 
         # Get currently selected item
         current_item = self.results_list.currentItem()
@@ -616,7 +626,6 @@ class OverlayWindow(QWidget):
     def _on_delete_snippets_clicked(self):
         """Open the Delete Snippets dialog."""
         from src.delete_snippets_dialog import DeleteSnippetsDialog
-        from PySide6.QtWidgets import QDialog
 
         # Mark dialog as open (prevents hotkey toggle)
         self.dialog_open = True
@@ -21,7 +21,10 @@ from PySide6.QtWidgets import (
     QMessageBox,
 )
 from PySide6.QtCore import Qt
-from datetime import datetime
+import time
+
+# Maximum number of backups listed in the dialog (older entries are summarized)
+MAX_LISTED_BACKUPS = 500
 
 
 class RestoreBackupDialog(QDialog):
@@ -81,11 +84,19 @@ class RestoreBackupDialog(QDialog):
         self.backup_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
         self.backup_list.itemDoubleClicked.connect(self._on_restore)
 
-        # Populate backup list
-        for backup in self.backups:
-            # Format timestamp
-            timestamp_str = datetime.fromtimestamp(backup["timestamp"]).strftime(
-                "%Y-%m-%d %H:%M:%S"
+        # Populate backup list (newest first)
+        self.backups = sorted(
+            self.backups, key=lambda b: b["timestamp"], reverse=True
+        )
+
+        # Suspend repaints/signals while adding items (one view update at the end)
+        self.backup_list.setUpdatesEnabled(False)
+        self.backup_list.blockSignals(True)
+
+        for backup in self.backups[:MAX_LISTED_BACKUPS]:
+            # Format timestamp (time.strftime avoids building datetime objects)
+            timestamp_str = time.strftime(
+                "%Y-%m-%d %H:%M:%S", time.localtime(backup["timestamp"])
             )
 
             # Create list item
@@ -95,6 +106,16 @@ class RestoreBackupDialog(QDialog):
 
             self.backup_list.addItem(item)
 
+        # Summarize backups beyond the display cap (not selectable)
+        hidden_count = len(self.backups) - MAX_LISTED_BACKUPS
+        if hidden_count > 0:
+            more_item = QListWidgetItem(f"… {hidden_count} more older backups …")
+            more_item.setFlags(Qt.ItemFlag.NoItemFlags)
+            self.backup_list.addItem(more_item)
+
+        self.backup_list.blockSignals(False)
+        self.backup_list.setUpdatesEnabled(True)
+
         layout.addWidget(self.backup_list)
 
         # Button layout
@@ -5,7 +5,11 @@ Provides an easy-to-use dialog for creating new snippets without
 manually editing YAML files.
 """
 
+import heapq
+import re
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Dict, List
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -18,9 +22,47 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QListView,
 )
-from PySide6.QtCore import Qt, QTimer, QObject, QEvent
+from PySide6.QtCore import Qt, QTimer, QObject, QEvent, QStringListModel
+from rapidfuzz import fuzz, process
 from src.fuzzy_tag_completer import FuzzyTagCompleter
 
+# Characters stripped from tags/IDs (keeps letters, digits, hyphens, underscores)
+_NORMALIZE_RE = re.compile(r"[^\w-]")
+
+# Keyboard events the popup must never handle (they belong to tags_input)
+_BLOCKED_KEY_EVENTS = frozenset(
+    {
+        QEvent.Type.KeyPress,
+        QEvent.Type.KeyRelease,
+        QEvent.Type.ShortcutOverride,
+        QEvent.Type.InputMethod,
+    }
+)
+
+# Activation events that would steal keyboard routing from tags_input
+_BLOCKED_ACTIVATION_EVENTS = frozenset(
+    {
+        QEvent.Type.WindowActivate,
+        QEvent.Type.ActivationChange,
+        QEvent.Type.FocusIn,
+    }
+)
+
+# Qt enums used in per-event handlers (bound once instead of per access)
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_KEY_ESC = Qt.Key.Key_Escape
+_KEY_TAB = Qt.Key.Key_Tab
+_KEY_RETURN = Qt.Key.Key_Return
+_KEY_ENTER = Qt.Key.Key_Enter
+
+
+@dataclass
+class TrieNode:
+    """Node in the lowercase tag prefix trie used for autocomplete."""
+
+    children: Dict[str, "TrieNode"] = field(default_factory=dict)
+    terminal_tags: List[str] = field(default_factory=list)
+
 
 class NoFocusListView(QListView):
     """Custom QListView that refuses to accept focus, preventing focus stealing."""
@@ -53,22 +95,15 @@ class NoFocusListView(QListView):
 
     def event(self, event):
         """Override event() to reject activation events that steal keyboard routing."""
+        event_type = event.type()
+
         # Reject keyboard events - they should go to tags_input
-        if event.type() in [
-            QEvent.Type.KeyPress,
-            QEvent.Type.KeyRelease,
-            QEvent.Type.ShortcutOverride,
-            QEvent.Type.InputMethod,
-        ]:
+        if event_type in _BLOCKED_KEY_EVENTS:
             event.ignore()
             return False  # Don't handle it
 
         # Reject window activation events (these steal keyboard routing!)
-        if event.type() in [
-            QEvent.Type.WindowActivate,
-            QEvent.Type.ActivationChange,
-            QEvent.Type.FocusIn,
-        ]:
+        if event_type in _BLOCKED_ACTIVATION_EVENTS:
             event.ignore()
             return False  # Don't handle activation
 
@@ -96,55 +131,61 @@ class InputFocusProtector(QObject):
         Returns:
             bool: True to block the event, False to allow it
         """
+        # Fast path: only key presses and focus-out events are of interest
+        event_type = event.type()
+        if event_type not in (QEvent.Type.KeyPress, QEvent.Type.FocusOut):
+            return False
+
+        popup = self.popup
+        visible = popup is not None and popup.isVisible()
+
         # Handle keyboard events
-        if event.type() == QEvent.Type.KeyPress:
+        if event_type == QEvent.Type.KeyPress:
+            if not visible:
+                return False
+
             key = event.key()
 
             # ESC key dismisses popup
-            if key == Qt.Key.Key_Escape and self.popup and self.popup.isVisible():
-                self.popup.hide()
+            if key == _KEY_ESC:
+                popup.hide()
                 return True  # Consume the ESC event
 
             # Tab key auto-completes with first item in list
-            if key == Qt.Key.Key_Tab and self.popup and self.popup.isVisible():
+            if key == _KEY_TAB:
                 # Get the first item from the popup's model
-                model = self.popup.model()
+                model = popup.model()
                 if model and model.rowCount() > 0:
                     first_index = model.index(0, 0)
-                    first_item = model.data(first_index, Qt.ItemDataRole.DisplayRole)
+                    first_item = model.data(first_index, _DISPLAY_ROLE)
                     if first_item and self.completion_handler:
                         # Trigger the selection handler
                         self.completion_handler(first_item)
                         return True  # Consume the Tab event
 
             # Enter/Return key selects highlighted item (if any) or first item
-            if (
-                key in [Qt.Key.Key_Return, Qt.Key.Key_Enter]
-                and self.popup
-                and self.popup.isVisible()
-            ):
+            elif key == _KEY_RETURN or key == _KEY_ENTER:
                 # Try to get currently selected item
-                current_index = self.popup.currentIndex()
-                model = self.popup.model()
+                current_index = popup.currentIndex()
+                model = popup.model()
                 if current_index.isValid() and model:
-                    selected_item = model.data(
-                        current_index, Qt.ItemDataRole.DisplayRole
-                    )
+                    selected_item = model.data(current_index, _DISPLAY_ROLE)
                     if selected_item and self.completion_handler:
                         self.completion_handler(selected_item)
                         return True  # Consume the Enter event
 
-        if event.type() == QEvent.Type.FocusOut:
-            # Hide popup when focus leaves tags_input (moving to another field)
-            focus_widget = obj.window().focusWidget()
+            return False
+
+        # FocusOut: hide popup when focus leaves tags_input (moving to another field)
+        focus_widget = obj.window().focusWidget()
 
-            # If focus is going to the popup, block it (keep focus on tags_input)
-            if focus_widget and isinstance(focus_widget, NoFocusListView):
-                return True
+        # If focus is going to the popup, block it (keep focus on tags_input)
+        if focus_widget and isinstance(focus_widget, NoFocusListView):
+            return True
 
-            # If focus is going to another widget (name, description, buttons), hide popup
-            if self.popup and self.popup.isVisible():
-                self.popup.hide()
+        # If focus is going to another widget (name, description, buttons), hide popup
+        if visible:
+            popup.hide()
 
         return False
 
@@ -165,6 +206,9 @@ class SnippetEditorDialog(QDialog):
         self.snippet_manager = snippet_manager
         self.snippet_data = None
         self.snippet = snippet  # Store snippet for edit mode
+        self.fuzzy_completer = None  # Set by _setup_completer (needs snippet_manager)
+        self.all_tags = []
+        self._popup_geom_dirty = True  # Cleared once popup position is cached
         self._setup_ui()
         self._setup_completer()
 
@@ -177,7 +221,7 @@ class SnippetEditorDialog(QDialog):
         Handle mouse clicks on the dialog.
         Hide popup if clicking outside of tags_input and popup.
         """
-        if hasattr(self, "fuzzy_completer"):
+        if self.fuzzy_completer is not None:
             popup = self.fuzzy_completer.popup()
             if popup and popup.isVisible():
                 # Check if click is outside tags_input - hide popup
@@ -185,6 +229,16 @@ class SnippetEditorDialog(QDialog):
                     popup.hide()
         super().mousePressEvent(event)
 
+    def moveEvent(self, event):
+        """Invalidate cached popup geometry when the dialog moves."""
+        self._popup_geom_dirty = True
+        super().moveEvent(event)
+
+    def resizeEvent(self, event):
+        """Invalidate cached popup geometry when the dialog is resized."""
+        self._popup_geom_dirty = True
+        super().resizeEvent(event)
+
     def _setup_ui(self):
         """Create and configure UI components."""
         # Set title based on mode (edit vs add)
@@ -268,6 +322,27 @@ class SnippetEditorDialog(QDialog):
 
         self.all_tags = self.snippet_manager.get_all_tags()
 
+        # Lowercased forms computed once (avoids tag.lower() on every keystroke)
+        self._all_tags_lower = [tag.lower() for tag in self.all_tags]
+        self._tag_pairs = list(zip(self.all_tags, self._all_tags_lower))
+        # {tag: tag_lower} for every tag (full fuzzy scan)
+        self._tags_lower_map = dict(self._tag_pairs)
+
+        # Suggestions shown when the current tag is empty (never changes)
+        self._empty_matches = self.all_tags[:10]
+
+        # Prefix trie (lowercased) for O(L) prefix lookups while typing
+        self.tag_trie = TrieNode()
+        # {tag: tag_lower} grouped by first character (fuzzy fallback candidates)
+        self._tags_by_first: Dict[str, Dict[str, str]] = {}
+        for tag, tag_lower in self._tag_pairs:
+            node = self.tag_trie
+            for char in tag_lower:
+                node = node.children.setdefault(char, TrieNode())
+            node.terminal_tags.append(tag)
+            if tag_lower:
+                self._tags_by_first.setdefault(tag_lower[0], {})[tag] = tag_lower
+
         # Use FuzzyTagCompleter for typo-tolerant suggestions
         self.fuzzy_completer = FuzzyTagCompleter(self.all_tags, self)
 
@@ -282,6 +357,12 @@ class SnippetEditorDialog(QDialog):
         # DON'T even call setWidget() - we'll position popup manually
         # This is the ONLY way to prevent Qt's auto-insertion
 
+        # Debounce timer: coalesces bursts of keystrokes into a single search
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(100)
+        self._search_timer.timeout.connect(self._run_tag_search)
+
         # Connect text changed signal for comma-separated tag handling
         # Block signals temporarily to prevent recursion
         self.tags_input.textChanged.connect(self._on_tags_input_changed)
@@ -314,10 +395,14 @@ class SnippetEditorDialog(QDialog):
         # Get reference to our custom popup for later use
         popup = self.fuzzy_completer.popup()
 
+        # Single persistent suggestions model, refilled on each search
+        self._popup_model = QStringListModel(self)
+        popup.setModel(self._popup_model)
+
         # Connect popup click to selection handler
         popup.clicked.connect(
             lambda index: self._on_completion_selected(
-                self.fuzzy_completer.model().data(index, Qt.ItemDataRole.DisplayRole)
+                self._popup_model.data(index, _DISPLAY_ROLE)
             )
         )
 
@@ -360,17 +445,31 @@ class SnippetEditorDialog(QDialog):
 
     def _on_tags_input_changed(self, text: str):
         """
-        Handle comma-separated tag input.
+        Handle tag input changes by (re)starting the search debounce timer.
 
-        Extracts the current tag being typed (after last comma) and
-        updates the completer to provide suggestions for that tag only.
+        Only the last keystroke in a burst triggers _run_tag_search.
 
         Args:
             text: Current text in tags_input field
         """
-        if not hasattr(self, "fuzzy_completer") or not hasattr(self, "all_tags"):
+        if self.fuzzy_completer is None:
             return
 
+        self._search_timer.start()
+
+    def _run_tag_search(self):
+        """
+        Handle comma-separated tag input.
+
+        Extracts the current tag being typed (after last comma) and
+        updates the completer to provide suggestions for that tag only.
+        Reads the current text of tags_input at call time.
+        """
+        if self.fuzzy_completer is None:
+            return
+
+        text = self.tags_input.text()
+
         # Extract current tag being typed (after last comma)
         if "," in text:
             # Split by comma and get the last part (current tag)
@@ -381,71 +480,114 @@ class SnippetEditorDialog(QDialog):
             current_tag = text
 
         # Get fuzzy matches manually
-        from rapidfuzz import fuzz
-        from PySide6.QtCore import QStringListModel
-
         if not current_tag.strip():
             # Show first 10 tags when empty
-            matches = self.all_tags[:10]
+            matches = self._empty_matches
         else:
-            # Consecutive character matching (prefix or substring)
             match_lower = current_tag.lower().strip()
-            scored_matches = []
 
-            for tag in self.all_tags:
-                tag_lower = tag.lower()
+            # Priority 1: Exact prefix match (e.g., "py" matches "python")
+            prefix_matches = self._collect_prefix_matches(match_lower, limit=10)
+
+            if len(prefix_matches) >= 10:
+                matches = prefix_matches
+            else:
+                prefix_set = set(prefix_matches)
+                scored_matches = [(tag, 100) for tag in prefix_matches]
 
-                # Priority 1: Exact prefix match (e.g., "py" matches "python")
-                if tag_lower.startswith(match_lower):
-                    score = 100
                 # Priority 2: Contains as consecutive substring (e.g., "side" matches "pyside")
-                elif match_lower in tag_lower:
-                    score = 80
-                # Priority 3: Fuzzy match for typos (e.g., "pyton" matches "python")
-                else:
-                    fuzzy_score = fuzz.ratio(match_lower, tag_lower)
-                    if fuzzy_score >= 70:  # Higher threshold for fuzzy
-                        score = fuzzy_score
-                    else:
-                        continue  # Skip this tag
-
-                scored_matches.append((tag, score))
-
-            # Sort by score (descending), then alphabetically
-            scored_matches.sort(key=lambda x: (-x[1], x[0]))
-            matches = [tag for tag, score in scored_matches[:10]]
+                substring_set = set()
+                for tag, tag_lower in self._tag_pairs:
+                    if tag not in prefix_set and match_lower in tag_lower:
+                        substring_set.add(tag)
+                        scored_matches.append((tag, 80))
+
+                # Priority 3: Fuzzy match for typos (e.g., "pyton" matches "python"),
+                # scored against tags sharing the first character, then against
+                # all tags if none of those match (a typo in the first character,
+                # e.g., "oython"); one rapidfuzz call per candidate set, mapping
+                # keys are the original tags
+                already_matched = len(prefix_set) + len(substring_set)
+                fuzzy_results = []
+                for candidates in (
+                    self._tags_by_first.get(match_lower[0]),
+                    self._tags_lower_map,
+                ):
+                    if candidates:
+                        fuzzy_results = process.extract(
+                            match_lower,
+                            candidates,
+                            scorer=fuzz.ratio,
+                            score_cutoff=70,  # Higher threshold for fuzzy
+                            limit=10 + already_matched,
+                        )
+                    if fuzzy_results:
+                        break
+                for _, fuzzy_score, tag in fuzzy_results:
+                    if tag not in prefix_set and tag not in substring_set:
+                        scored_matches.append((tag, fuzzy_score))
+
+                # Top 10 by score (descending), then alphabetically
+                top = heapq.nsmallest(10, scored_matches, key=lambda x: (-x[1], x[0]))
+                matches = [tag for tag, _ in top]
 
         # Get popup reference and update model
         popup = self.fuzzy_completer.popup()
-        model = QStringListModel(matches)
-        popup.setModel(model)
+        self._popup_model.setStringList(matches)
 
         # Show/update/hide the popup
         if matches:
             # Only show popup if it's not already visible
             if not popup.isVisible():
-                # Position popup below the tags_input field
-                input_pos = self.tags_input.mapToGlobal(
-                    self.tags_input.rect().bottomLeft()
-                )
-                popup_width = max(self.tags_input.width(), 200)
-                popup.setFixedWidth(popup_width)
-                popup.move(input_pos)
+                # Position popup below the tags_input field (recomputed only
+                # after the dialog has moved or been resized)
+                if self._popup_geom_dirty:
+                    input_pos = self.tags_input.mapToGlobal(
+                        self.tags_input.rect().bottomLeft()
+                    )
+                    popup_width = max(self.tags_input.width(), 200)
+                    popup.setFixedWidth(popup_width)
+                    popup.move(input_pos)
+                    self._popup_geom_dirty = False
 
                 # Show and raise the popup
                 popup.show()
                 popup.raise_()
 
                 # Ensure focus stays on tags_input (prevents OS-level window activation)
-                from PySide6.QtWidgets import QApplication
-
                 self.tags_input.setFocus(Qt.FocusReason.OtherFocusReason)
-                QApplication.processEvents()
         else:
             # No matches - hide popup
             if popup.isVisible():
                 popup.hide()
 
+    def _collect_prefix_matches(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Collect tags starting with prefix by walking the tag trie.
+
+        Args:
+            prefix: Lowercased prefix being typed
+            limit: Maximum number of tags to return
+
+        Returns:
+            Up to `limit` tags with the given prefix, in alphabetical order
+        """
+        node = self.tag_trie
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        # Bounded depth-first walk of the subtree (alphabetical order)
+        results = []
+        stack = [node]
+        while stack and len(results) < limit:
+            current = stack.pop()
+            results.extend(current.terminal_tags[: limit - len(results)])
+            for char in sorted(current.children, reverse=True):
+                stack.append(current.children[char])
+        return results
+
     def _on_save(self):
         """Validate and save snippet data."""
         # Get values
@@ -474,9 +616,7 @@ class SnippetEditorDialog(QDialog):
                     # Normalize: lowercase, replace spaces with dashes
                     normalized_tag = tag.lower().replace(" ", "-")
                     # Remove special characters except hyphens and underscores
-                    normalized_tag = "".join(
-                        c for c in normalized_tag if c.isalnum() or c in "-_"
-                    )
+                    normalized_tag = _NORMALIZE_RE.sub("", normalized_tag)
                     if normalized_tag:  # Only add if not empty after normalization
                         tags.append(normalized_tag)
         else:
@@ -485,7 +625,7 @@ class SnippetEditorDialog(QDialog):
         # Generate ID from name (lowercase, replace spaces with hyphens)
         snippet_id = name.lower().replace(" ", "-")
         # Remove special characters except hyphens and underscores
-        snippet_id = "".join(c for c in snippet_id if c.isalnum() or c in "-_")
+        snippet_id = _NORMALIZE_RE.sub("", snippet_id)
 
         # Get current timestamp
         today = datetime.now().strftime("%Y-%m-%d")
@@ -13,16 +13,43 @@ Key responsibilities:
 - Auto-fix duplicate snippet IDs (append "-1", "-2", etc.)
 """
 
+import operator
+import os
+import re
 import yaml
 import shutil
 import logging
-import time
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
+from src.yaml_io import SafeDumper, yaml_load, yaml_dump
+
+# Snippet fields that must be present and non-empty
+_REQUIRED_FIELDS = frozenset(("id", "name", "content"))
+_REQUIRED_GETTER = operator.itemgetter("id", "name", "content")
+_DATE_FIELDS = ("created", "modified")
+
+# Header written before the snippet entries by _save_snippets
+_SNIPPETS_FILE_HEADER = "version: 1\nsnippets:\n"
+
+
+class _SnippetDumper(SafeDumper):
+    """Safe dumper that writes dates as quoted ISO strings."""
+
+
+_SnippetDumper.add_representer(
+    date, lambda dumper, value: dumper.represent_str(value.isoformat())
+)
+
+# Indentation of the first item of a block-style top-level "snippets:" list
+_SNIPPETS_ITEM_INDENT_RE = re.compile(
+    rb"^snippets:[ \t]*\r?\n(?:[ \t]*(?:#[^\n]*)?\r?\n)*([ \t]*)- ", re.MULTILINE
+)
 
 
 # ============================================================================
@@ -76,6 +103,27 @@ class Snippet:
         return all(required) and len(self.id) > 0
 
 
+def _snippet_to_dict(snippet: Snippet) -> dict:
+    """
+    Convert a Snippet into the dictionary layout used in snippets.yaml.
+
+    Args:
+        snippet: Snippet to convert
+
+    Returns:
+        Dictionary with fields in file order
+    """
+    return {
+        "id": snippet.id,
+        "name": snippet.name,
+        "description": snippet.description,
+        "content": snippet.content,
+        "tags": snippet.tags,
+        "created": snippet.created,
+        "modified": snippet.modified,
+    }
+
+
 # ============================================================================
 # SnippetManager Class
 # ============================================================================
@@ -111,6 +159,29 @@ class SnippetManager:
         self.last_good_state: List[Snippet] = []
         self._debounce_timer = None
         self._reload_pending = False
+        # (snippet list, sorted tags) for get_all_tags; holding the list
+        # itself keeps its identity from being reused by a new list
+        self._tags_cache: Optional[Tuple[List[Snippet], List[str]]] = None
+        # (mtime_ns, size) of the file when _cache_value was parsed
+        self._cache_key: Optional[Tuple[int, int]] = None
+        self._cache_value: Optional[List[Snippet]] = None
+        # Raw IDs in the file and item indent for append-only add_snippet,
+        # valid while the file's (mtime_ns, size) equals _append_key
+        self._append_key: Optional[Tuple[int, int]] = None
+        self._append_indent: Optional[str] = None
+        self._file_ids: set = set()
+        self._id_suffixes: dict = {}
+        # Parallel (structure-of-arrays) views of the parsed snippets, valid
+        # while self.snippets is _index_key
+        self._index_key: Optional[List[Snippet]] = None
+        self._ids: List[str] = []
+        self._id_index: Dict[str, int] = {}
+        self._tags_lists: List[List[str]] = []
+        # Matches this file's rotation backups (<name>.backup.NNN); the name
+        # is fixed, so it is escaped and compiled once
+        self._backup_re = re.compile(
+            rf"{re.escape(self.file_path.name)}\.backup\.(\d{{3}})$"
+        )
 
     def load(self) -> List[Snippet]:
         """
@@ -118,6 +189,8 @@ class SnippetManager:
 
         If file doesn't exist, creates a sample file.
         If file is malformed, falls back to last known good state.
+        If the file's mtime and size are unchanged since the last successful
+        parse, the cached snippets are returned without re-reading it.
 
         Returns:
             List of Snippet objects
@@ -126,22 +199,40 @@ class SnippetManager:
             self._create_sample_file()
 
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            st = self.file_path.stat()
+            cache_key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            cache_key = None
+
+        if cache_key is not None and cache_key == self._cache_key and self._cache_value:
+            self.snippets = self._cache_value
+            return self._cache_value
+
+        try:
+            # Binary handle: the YAML loader decodes UTF-8 itself
+            with open(self.file_path, "rb") as f:
+                raw = f.read()
+            data = yaml_load(raw)
 
             if not data or "snippets" not in data:
-                logger.warning(f"Invalid YAML structure in {self.file_path}")
+                logger.warning("Invalid YAML structure in %s", self.file_path)
                 return self.last_good_state
 
+            self._record_append_state(raw, data, cache_key)
+
             snippets = self._parse_snippets(data["snippets"])
             snippets = self._fix_duplicate_ids(snippets)
             self.snippets = snippets
             self.last_good_state = snippets
-            logger.info(f"Loaded {len(snippets)} snippets from {self.file_path}")
+            self._index_snippets(snippets)
+            self._tags_cache = None
+            self._cache_key = cache_key
+            self._cache_value = snippets
+            logger.info("Loaded %d snippets from %s", len(snippets), self.file_path)
             return snippets
 
         except yaml.YAMLError as e:
-            logger.error(f"YAML parsing error in {self.file_path}: {e}")
+            logger.error("YAML parsing error in %s: %s", self.file_path, e)
             return self.last_good_state
 
         except FileNotFoundError:
@@ -149,13 +240,90 @@ class SnippetManager:
             return self.load()
 
         except PermissionError as e:
-            logger.warning(f"Permission denied reading {self.file_path}: {e}")
+            logger.warning("Permission denied reading %s: %s", self.file_path, e)
             return self.last_good_state
 
         except Exception as e:
-            logger.error(f"Unexpected error loading snippets: {e}")
+            logger.error("Unexpected error loading snippets: %s", e)
             return self.last_good_state
 
+    def _index_snippets(self, snippets: List[Snippet]) -> None:
+        """
+        Build parallel ID/tag lists and an ID -> position index for snippets.
+
+        Args:
+            snippets: Freshly parsed snippets (becomes self.snippets)
+        """
+        self._ids = [s.id for s in snippets]
+        self._id_index = {snippet_id: i for i, snippet_id in enumerate(self._ids)}
+        self._tags_lists = [s.tags for s in snippets]
+        self._index_key = snippets
+
+    def _record_append_state(self, raw: bytes, data: dict, cache_key) -> None:
+        """
+        Remember what add_snippet needs to append without re-parsing the file.
+
+        Appending is only possible when "snippets" is the last top-level key,
+        holds a non-empty block-style list and the file ends with a newline.
+
+        Args:
+            raw: Raw file contents that were parsed
+            data: Parsed YAML document
+            cache_key: (mtime_ns, size) of the file when raw was read
+        """
+        self._append_key = None
+        entries = data.get("snippets") if isinstance(data, dict) else None
+        if not isinstance(entries, list) or cache_key is None:
+            return
+
+        self._file_ids = {e.get("id") for e in entries if isinstance(e, dict)}
+        self._id_suffixes = {}
+
+        if not entries or list(data)[-1] != "snippets" or not raw.endswith(b"\n"):
+            return
+        match = _SNIPPETS_ITEM_INDENT_RE.search(raw)
+        if match is None:
+            return
+
+        self._append_indent = match.group(1).decode("ascii")
+        self._append_key = cache_key
+
+    def _append_snippet_entry(self, snippet_data: dict) -> None:
+        """
+        Append a single rendered snippet to the end of the snippets list.
+
+        Args:
+            snippet_data: Snippet dictionary (ID already de-duplicated)
+        """
+        rendered = yaml_dump(
+            [snippet_data],
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        )
+        if self._append_indent:
+            rendered = "".join(
+                self._append_indent + line if line.strip() else line
+                for line in rendered.splitlines(keepends=True)
+            )
+
+        with open(self.file_path, "ab") as f:
+            f.write(rendered.encode("utf-8"))
+
+        st = self.file_path.stat()
+        self._file_ids.add(snippet_data["id"])
+        self._append_key = (st.st_mtime_ns, st.st_size)
+
+    def _can_append(self) -> bool:
+        """Check whether the file is unchanged since _record_append_state."""
+        if self._append_key is None:
+            return False
+        try:
+            st = self.file_path.stat()
+        except OSError:
+            return False
+        return (st.st_mtime_ns, st.st_size) == self._append_key
+
     def _create_sample_file(self):
         """
         Create sample snippets.yaml if missing.
@@ -240,7 +408,7 @@ snippets:
 """
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
         self.file_path.write_text(sample_content, encoding="utf-8")
-        logger.info(f"Created sample snippets file at {self.file_path}")
+        logger.info("Created sample snippets file at %s", self.file_path)
 
     def _parse_snippets(self, data: List[dict]) -> List[Snippet]:
         """
@@ -252,56 +420,65 @@ snippets:
         Returns:
             List of valid Snippet objects
         """
-        snippets = []
-        for snippet_dict in data:
-            try:
-                # Validate required fields
+        # Entries that pass the schema check cannot raise while building,
+        # so no per-snippet exception handling is needed
+        today = date.today()
+        snippets = [
+            self._build_snippet(snippet_dict, today)
+            for snippet_dict in data
+            if self._validate_schema(snippet_dict)
+        ]
+
+        if len(snippets) != len(data):
+            for snippet_dict in data:
                 if not self._validate_schema(snippet_dict):
-                    logger.warning(
-                        f"Invalid snippet schema: {snippet_dict.get('id', 'unknown')}"
+                    snippet_id = (
+                        snippet_dict.get("id", "unknown")
+                        if isinstance(snippet_dict, dict)
+                        else "unknown"
                     )
-                    continue
-
-                # Parse dates
-                created = snippet_dict.get("created")
-                modified = snippet_dict.get("modified")
-
-                if isinstance(created, str):
-                    created = date.fromisoformat(created)
-                elif not isinstance(created, date):
-                    created = date.today()
-
-                if isinstance(modified, str):
-                    modified = date.fromisoformat(modified)
-                elif not isinstance(modified, date):
-                    modified = date.today()
-
-                # Create Snippet object
-                snippet = Snippet(
-                    id=snippet_dict["id"],
-                    name=snippet_dict["name"],
-                    description=snippet_dict.get("description", ""),
-                    content=snippet_dict["content"],
-                    tags=snippet_dict.get("tags", []),
-                    created=created,
-                    modified=modified,
-                )
+                    logger.warning("Invalid snippet schema: %s", snippet_id)
 
-                # Validate snippet
-                if snippet.validate():
-                    snippets.append(snippet)
-                else:
-                    logger.warning(f"Snippet validation failed: {snippet.id}")
+        return snippets
 
-            except Exception as e:
-                logger.warning(f"Error parsing snippet: {e}")
-                continue
+    def _build_snippet(self, snippet_dict: dict, today: date) -> Snippet:
+        """
+        Build a Snippet from a dictionary that passed _validate_schema.
 
-        return snippets
+        Args:
+            snippet_dict: Snippet dictionary from YAML
+            today: Default for missing created/modified dates
+
+        Returns:
+            Snippet object
+        """
+        # Parse dates (the YAML loader already resolves unquoted
+        # YYYY-MM-DD values to date objects; only strings need parsing)
+        created = snippet_dict.get("created") or today
+        if not isinstance(created, date):
+            created = date.fromisoformat(created) if isinstance(created, str) else today
+
+        modified = snippet_dict.get("modified") or today
+        if not isinstance(modified, date):
+            modified = (
+                date.fromisoformat(modified) if isinstance(modified, str) else today
+            )
+
+        return Snippet(
+            id=snippet_dict["id"],
+            name=snippet_dict["name"],
+            description=snippet_dict.get("description", ""),
+            content=snippet_dict["content"],
+            tags=snippet_dict.get("tags", []),
+            created=created,
+            modified=modified,
+        )
 
     def _validate_schema(self, snippet_dict: dict) -> bool:
         """
-        Validate snippet dictionary has required fields.
+        Validate snippet dictionary has required fields and valid dates.
+
+        Covers everything that could make _build_snippet raise.
 
         Args:
             snippet_dict: Dictionary containing snippet data
@@ -309,11 +486,22 @@ snippets:
         Returns:
             True if valid, False otherwise
         """
-        required_fields = ["id", "name", "content"]
+        if not (
+            isinstance(snippet_dict, dict)
+            and _REQUIRED_FIELDS <= snippet_dict.keys()
+            and all(_REQUIRED_GETTER(snippet_dict))
+            and isinstance(snippet_dict["id"], str)
+        ):
+            return False
 
-        for field in required_fields:
-            if field not in snippet_dict or not snippet_dict[field]:
-                return False
+        # Date strings must be valid ISO dates (date objects are already parsed)
+        for field in _DATE_FIELDS:
+            value = snippet_dict.get(field)
+            if isinstance(value, str) and value:
+                try:
+                    date.fromisoformat(value)
+                except ValueError:
+                    return False
 
         return True
 
@@ -328,48 +516,117 @@ snippets:
             List of snippets with unique IDs
         """
         seen_ids = {}
+        # Next suffix to try per base ID (lower suffixes are already taken)
+        next_suffix = {}
 
         for snippet in snippets:
             if snippet.id in seen_ids:
-                counter = 1
+                counter = next_suffix.get(snippet.id, 1)
                 new_id = f"{snippet.id}-{counter}"
                 while new_id in seen_ids:
                     counter += 1
                     new_id = f"{snippet.id}-{counter}"
+                next_suffix[snippet.id] = counter + 1
 
-                logger.warning(f"Duplicate ID '{snippet.id}' renamed to '{new_id}'")
+                logger.warning("Duplicate ID '%s' renamed to '%s'", snippet.id, new_id)
                 snippet.id = new_id
 
             seen_ids[snippet.id] = True
 
         return snippets
 
-    def create_backup(self):
+    @contextmanager
+    def _atomic_write(self, backup: bool = False):
+        """
+        Open a sibling temp file for writing and move it over the snippets file.
+
+        The file is replaced with os.replace only after the block completes,
+        so readers (and hardlinked backups) never see a partial write.
+
+        Args:
+            backup: Rotate backups once the new contents are safely on disk,
+                hardlinking .backup.001 to the old file just before it is
+                replaced. Nothing is backed up if writing fails, and a link
+                is never left pointing at the live file.
+
+        Yields:
+            Text file handle (UTF-8) for the new file contents
+        """
+        tmp_path = self.file_path.with_name(self.file_path.name + ".tmp")
+        linked = False
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                yield f
+                f.flush()
+                os.fsync(f.fileno())
+            if backup:
+                self.create_backup(link=True)
+                linked = True
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            if linked:
+                self._detach_backup()
+            raise
+
+    def _detach_backup(self):
+        """
+        Turn .backup.001 into an independent copy if it is still a hardlink
+        to the live snippets file (so later in-place writes can't alter it).
+        """
+        backup_path = Path(f"{self.file_path}.backup.001")
+        try:
+            if backup_path.exists() and os.path.samefile(self.file_path, backup_path):
+                tmp_path = backup_path.with_name(backup_path.name + ".tmp")
+                shutil.copy2(self.file_path, tmp_path)
+                os.replace(tmp_path, backup_path)
+        except OSError as e:
+            logger.warning("Could not detach backup %s: %s", backup_path, e)
+
+    def create_backup(self, link: bool = False):
         """
         Create backup file before write operations.
 
         Rotates backups: .005 → delete, .004 → .005, ..., current → .001
         Maintains maximum of 5 backups.
+
+        Args:
+            link: Hardlink the backup instead of copying it (no bytes copied).
+                Only safe once the replacement is fully written and about to
+                be moved into place (see _atomic_write); an in-place write
+                would change the backup too.
         """
         try:
-            # Rotate backups: shift old backups
-            for i in range(5, 0, -1):
-                backup_file = Path(f"{self.file_path}.backup.{i:03d}")
-                if i == 5 and backup_file.exists():
-                    backup_file.unlink()  # Delete oldest
-                elif i < 5:
-                    next_backup = Path(f"{self.file_path}.backup.{i+1:03d}")
-                    if backup_file.exists():
-                        backup_file.rename(next_backup)
+            # Find existing rotation backups with a single directory listing
+            existing = {}
+            with os.scandir(self.file_path.parent) as it:
+                for entry in it:
+                    match = self._backup_re.match(entry.name)
+                    if match and 1 <= int(match.group(1)) <= 5:
+                        existing[int(match.group(1))] = entry.path
+
+            # Rotate backups: delete oldest, then shift the rest up by one
+            if 5 in existing:
+                os.unlink(existing.pop(5))
+            for i in sorted(existing, reverse=True):
+                os.replace(existing[i], f"{self.file_path}.backup.{i+1:03d}")
 
             # Create new backup.001 from current file
             if self.file_path.exists():
                 backup_path = Path(f"{self.file_path}.backup.001")
-                shutil.copy2(self.file_path, backup_path)
-                logger.info(f"Created backup: {backup_path}")
+                backup_path.unlink(missing_ok=True)
+                if link:
+                    try:
+                        os.link(self.file_path, backup_path)
+                    except OSError:
+                        # Cross-device or no hardlink support (e.g. FAT)
+                        shutil.copy2(self.file_path, backup_path)
+                else:
+                    shutil.copy2(self.file_path, backup_path)
+                logger.info("Created backup: %s", backup_path)
 
         except Exception as e:
-            logger.warning(f"Could not create backup: {e}")
+            logger.warning("Could not create backup: %s", e)
 
     def watch_file(self, callback):
         """
@@ -388,22 +645,51 @@ snippets:
             def __init__(self, manager, callback):
                 self.manager = manager
                 self.callback = callback
-                self.last_reload = 0
                 self.debounce_delay = 0.5  # 500ms
+                self._timer = None
+                self._lock = threading.Lock()
+                # Normalized path of the watched file, compared per event
+                self._expected = os.path.normcase(
+                    os.path.abspath(str(manager.file_path))
+                )
+
+            def _is_snippets_file(self, path) -> bool:
+                """Check whether an event path refers to the snippets file."""
+                return os.path.normcase(os.path.abspath(path)) == self._expected
+
+            def _schedule_callback(self):
+                """Restart the debounce timer (trailing-edge debounce)."""
+                # Restart the timer on every event so the callback runs
+                # once, after the burst of writes has finished
+                with self._lock:
+                    if self._timer is not None:
+                        self._timer.cancel()
+                    self._timer = threading.Timer(self.debounce_delay, self.callback)
+                    self._timer.daemon = True
+                    self._timer.start()
 
             def on_modified(self, event):
                 """Handle file modification event."""
-                if event.src_path.endswith("snippets.yaml"):
-                    now = time.time()
-                    if now - self.last_reload > self.debounce_delay:
-                        self.last_reload = now
-                        self.callback()
+                if not event.is_directory and self._is_snippets_file(event.src_path):
+                    self._schedule_callback()
+
+            def on_created(self, event):
+                """Handle file creation (editors that save by recreating)."""
+                if not event.is_directory and self._is_snippets_file(event.src_path):
+                    self._schedule_callback()
+
+            def on_moved(self, event):
+                """Handle rename onto the snippets file (atomic saves)."""
+                if not event.is_directory and self._is_snippets_file(
+                    event.dest_path
+                ):
+                    self._schedule_callback()
 
         handler = DebouncedHandler(self, callback)
         observer = Observer()
         observer.schedule(handler, path=str(self.file_path.parent), recursive=False)
         observer.start()
-        logger.info(f"Started file watcher for {self.file_path}")
+        logger.info("Started file watcher for %s", self.file_path)
         return observer
 
     def add_snippet(self, snippet_data: dict) -> bool:
@@ -417,47 +703,66 @@ snippets:
             True if successful, False otherwise
         """
         try:
-            # Create backup before modification
-            self.create_backup()
+            # Fast path: append just the new entry when the file is unchanged
+            # since it was last parsed; otherwise load, modify and rewrite it
+            append_only = self._can_append()
+
+            if append_only:
+                # Appending changes the file in place, so back up with a copy
+                self.create_backup()
+                data = None
+                existing_ids = self._file_ids
+            else:
+                with open(self.file_path, "rb") as f:
+                    data = yaml_load(f)
 
-            # Load current YAML data
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                if not data:
+                    data = {"snippets": []}
 
-            if not data:
-                data = {"snippets": []}
+                existing_ids = {s["id"] for s in data.get("snippets", [])}
 
-            # Check for duplicate ID
-            existing_ids = {s["id"] for s in data.get("snippets", [])}
+            # Check for duplicate ID (suffix counters persist across appends,
+            # since the ID set only grows until the file is re-parsed)
+            next_suffix = self._id_suffixes if append_only else {}
             original_id = snippet_data["id"]
             snippet_id = original_id
-            counter = 1
 
-            while snippet_id in existing_ids:
+            if snippet_id in existing_ids:
+                counter = next_suffix.get(original_id, 1)
                 snippet_id = f"{original_id}-{counter}"
-                counter += 1
+                while snippet_id in existing_ids:
+                    counter += 1
+                    snippet_id = f"{original_id}-{counter}"
+                next_suffix[original_id] = counter + 1
 
             # Update ID if changed
             snippet_data["id"] = snippet_id
 
-            # Append new snippet
-            data.setdefault("snippets", []).append(snippet_data)
-
-            # Write back to file
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                yaml.dump(
-                    data,
-                    f,
-                    default_flow_style=False,
-                    allow_unicode=True,
-                    sort_keys=False,
-                )
+            if append_only:
+                self._append_snippet_entry(snippet_data)
+            else:
+                # Append new snippet
+                data.setdefault("snippets", []).append(snippet_data)
+
+                # Write back to file (backed up once the new file is written)
+                with self._atomic_write(backup=True) as f:
+                    yaml_dump(
+                        data,
+                        f,
+                        default_flow_style=False,
+                        allow_unicode=True,
+                        sort_keys=False,
+                    )
 
-            logger.info(f"Added new snippet: {snippet_data['name']} (ID: {snippet_id})")
+            self._tags_cache = None
+            self._cache_key = None
+            logger.info(
+                "Added new snippet: %s (ID: %s)", snippet_data["name"], snippet_id
+            )
             return True
 
         except Exception as e:
-            logger.error(f"Failed to add snippet: {e}")
+            logger.error("Failed to add snippet: %s", e)
             return False
 
     def update_snippet(self, snippet_id: str, snippet_data: dict) -> bool:
@@ -472,12 +777,9 @@ snippets:
             True if successful, False otherwise
         """
         try:
-            # Create backup before modification
-            self.create_backup()
-
             # Load current YAML data
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            with open(self.file_path, "rb") as f:
+                data = yaml_load(f)
 
             if not data or "snippets" not in data:
                 logger.error("No snippets found in file")
@@ -503,12 +805,12 @@ snippets:
                     break
 
             if not found:
-                logger.error(f"Snippet with ID {snippet_id} not found")
+                logger.error("Snippet with ID %s not found", snippet_id)
                 return False
 
-            # Write back to file
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                yaml.dump(
+            # Write back to file (backed up once the new file is written)
+            with self._atomic_write(backup=True) as f:
+                yaml_dump(
                     data,
                     f,
                     default_flow_style=False,
@@ -516,24 +818,38 @@ snippets:
                     sort_keys=False,
                 )
 
-            logger.info(f"Updated snippet: {snippet_data['name']} (ID: {snippet_id})")
+            self._tags_cache = None
+            self._cache_key = None
+            logger.info(
+                "Updated snippet: %s (ID: %s)", snippet_data["name"], snippet_id
+            )
             return True
 
         except Exception as e:
-            logger.error(f"Failed to update snippet: {e}")
+            logger.error("Failed to update snippet: %s", e)
             return False
 
     def get_all_tags(self) -> List[str]:
         """
         Get all unique tags from loaded snippets.
 
+        The result is cached per snippet list (keyed on its identity) and
+        reset when snippets are reloaded, added, updated or deleted; callers
+        must not mutate the returned list.
+
         Returns:
             Sorted list of unique tags from all snippets
         """
-        tags = set()
-        for snippet in self.snippets:
-            tags.update(snippet.tags)
-        return sorted(tags)
+        key = self.snippets
+        if self._tags_cache is not None and self._tags_cache[0] is key:
+            return self._tags_cache[1]
+
+        if self._index_key is key:
+            tags = sorted(set().union(*self._tags_lists))
+        else:
+            tags = sorted({tag for snippet in self.snippets for tag in snippet.tags})
+        self._tags_cache = (key, tags)
+        return tags
 
     def delete_snippets(self, snippet_ids: List[str]) -> None:
         """
@@ -546,71 +862,61 @@ snippets:
             ValueError: If any snippet ID is not found
             IOError: If YAML file cannot be written
         """
-        # Load current snippets
+        # Current snippets (served from the parse cache if the file is unchanged)
         current_snippets = self.load()
 
         # Verify all IDs exist
-        existing_ids = {s.id for s in current_snippets}
-        for snippet_id in snippet_ids:
-            if snippet_id not in existing_ids:
-                raise ValueError(f"Snippet with ID '{snippet_id}' not found")
-
-        # Create backup before deletion
-        self.create_backup()
+        to_delete = set(snippet_ids)
+        if self._index_key is current_snippets:
+            missing = {sid for sid in to_delete if sid not in self._id_index}
+        else:
+            missing = to_delete - {s.id for s in current_snippets}
+        if missing:
+            first_missing = next(sid for sid in snippet_ids if sid in missing)
+            raise ValueError(f"Snippet with ID '{first_missing}' not found")
 
         # Filter out snippets to delete
-        remaining_snippets = [s for s in current_snippets if s.id not in snippet_ids]
+        remaining_snippets = [s for s in current_snippets if s.id not in to_delete]
 
-        # Save updated snippets
-        self._save_snippets(remaining_snippets)
+        # Save updated snippets (backed up once the new file is written)
+        self._save_snippets(remaining_snippets, backup=True)
+        self._tags_cache = None
 
-        logger.info(f"Deleted {len(snippet_ids)} snippet(s): {snippet_ids}")
+        logger.info("Deleted %d snippet(s): %s", len(snippet_ids), snippet_ids)
 
-    def _save_snippets(self, snippets: List[Snippet]) -> None:
+    def _save_snippets(self, snippets: List[Snippet], backup: bool = False) -> None:
         """
         Save snippets to YAML file.
 
         Args:
             snippets: List of Snippet objects to save
+            backup: Rotate backups before the new file replaces the old one
 
         Raises:
             IOError: If file cannot be written
         """
-        # Convert snippets to dict format
-        snippets_data = {
-            "version": 1,
-            "snippets": [
-                {
-                    "id": s.id,
-                    "name": s.name,
-                    "description": s.description,
-                    "content": s.content,
-                    "tags": s.tags,
-                    "created": s.created.isoformat()
-                    if isinstance(s.created, date)
-                    else s.created,
-                    "modified": s.modified.isoformat()
-                    if isinstance(s.modified, date)
-                    else s.modified,
-                }
-                for s in snippets
-            ],
-        }
-
-        # Write to file
+        # Write to file: constant header, then one entry at a time
         try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                yaml.dump(
-                    snippets_data,
-                    f,
-                    default_flow_style=False,
-                    allow_unicode=True,
-                    sort_keys=False,
-                )
-
-            logger.info(f"Saved {len(snippets)} snippets to {self.file_path}")
+            with self._atomic_write(backup=backup) as f:
+                if not snippets:
+                    f.write("version: 1\nsnippets: []\n")
+                else:
+                    f.write(_SNIPPETS_FILE_HEADER)
+                    for s in snippets:
+                        yaml_dump(
+                            [_snippet_to_dict(s)],
+                            f,
+                            Dumper=_SnippetDumper,
+                            default_flow_style=False,
+                            allow_unicode=True,
+                            sort_keys=False,
+                        )
+
+            self._cache_key = None
+            self._tags_cache = None
+            logger.info("Saved %d snippets to %s", len(snippets), self.file_path)
         except Exception as e:
-            logger.error(f"Failed to save snippets: {e}")
+            logger.error("Failed to save snippets: %s", e)
             raise IOError(f"Failed to save snippets: {e}")
 
     def get_all_snippets(self) -> List[Snippet]:
@@ -642,12 +948,12 @@ snippets:
 
             # Copy current file to backup
             shutil.copy2(self.file_path, backup_path)
-            logger.info(f"Created manual backup: {backup_path}")
+            logger.info("Created manual backup: %s", backup_path)
 
             return str(backup_path)
 
         except Exception as e:
-            logger.error(f"Failed to create manual backup: {e}")
+            logger.error("Failed to create manual backup: %s", e)
             raise
 
     def list_backups(self) -> List[dict]:
@@ -708,15 +1014,19 @@ snippets:
             raise ValueError(f"Backup file not found: {backup_path}")
 
         try:
-            # Copy backup to current file
-            shutil.copy2(backup_file, self.file_path)
-            logger.info(f"Restored snippets from backup: {backup_path}")
-
-            # Reload snippets
+            # Copy backup over the current file (via a temp file, so the
+            # current inode, which may be hardlinked to a backup, is untouched)
+            tmp_path = self.file_path.with_name(self.file_path.name + ".tmp")
+            shutil.copy2(backup_file, tmp_path)
+            os.replace(tmp_path, self.file_path)
+            logger.info("Restored snippets from backup: %s", backup_path)
+
+            # Reload snippets (copy2 keeps the backup's mtime, so force a parse)
+            self._cache_key = None
             self.load()
 
         except Exception as e:
-            logger.error(f"Failed to restore from backup: {e}")
+            logger.error("Failed to restore from backup: %s", e)
             raise IOError(f"Failed to restore from backup: {e}")
 
     def get_sorted_snippets(self, usage_tracker) -> List[Snippet]:
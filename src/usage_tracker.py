@@ -1,7 +1,8 @@
 """
 Usage Tracker Module
 
-Tracks snippet usage frequency and persists statistics to YAML file.
+Tracks snippet usage frequency and persists statistics to a JSON file
+(or a YAML file, for stats files created by older versions).
 
 Key features:
 - Track how many times each snippet is copied
@@ -10,19 +11,44 @@ Key features:
 - Thread-safe increment operations
 """
 
+import json
+import os
 import yaml
 import logging
+import threading
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional
+from src.yaml_io import yaml_load, yaml_dump
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(raw: bytes):
+    """Decode JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data) -> bytes:
+    """Encode data as indented, key-sorted JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
 class UsageTracker:
     """
     Tracks snippet usage frequency and persists to file.
 
-    Usage statistics are stored in YAML format:
+    Usage statistics are stored as JSON when the stats file ends in
+    ``.json``, otherwise in the legacy YAML format:
     ```yaml
     snippet_usage:
       snippet-id-1: 42
@@ -30,54 +56,79 @@ class UsageTracker:
       snippet-id-3: 8
     ```
 
+    A missing ``.json`` stats file is migrated from a ``.yaml`` file with
+    the same name on load; the JSON file is written on the next save.
+
     Methods:
         increment(snippet_id): Increment usage count for snippet
+        increment_many(snippet_ids): Increment usage counts for several snippets
         get_count(snippet_id): Get usage count for snippet
         get_all_counts(): Get all usage counts as dict
-        save(): Persist usage statistics to file
+        save(): Persist usage statistics to file (no-op if nothing changed)
+        flush(): Cancel any pending debounced save and save now
         cleanup_orphaned(valid_ids): Remove stats for deleted snippets
     """
 
-    def __init__(self, stats_file: str):
+    def __init__(self, stats_file: str, save_debounce_s: Optional[float] = None):
         """
         Initialize UsageTracker.
 
         Args:
-            stats_file: Path to usage statistics YAML file
+            stats_file: Path to usage statistics file (.json or .yaml)
+            save_debounce_s: If set, increments schedule a save this many
+                seconds after the last one (coalescing bursts into one write)
         """
         self.stats_file = Path(stats_file)
-        self.usage_counts: Dict[str, int] = {}
+        self.usage_counts: Counter[str] = Counter()
+        self.save_debounce_s = save_debounce_s
+        self._dirty = False  # True when counts changed since the last save
+        self._save_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()  # Guards counts, _dirty and the timer
+        self._write_lock = threading.Lock()  # Serializes file writes
         self._load()
 
     def _load(self):
         """Load usage statistics from file."""
-        if not self.stats_file.exists():
-            logger.info(f"Usage stats file not found: {self.stats_file}, starting with empty stats")
-            self.usage_counts = {}
-            return
+        source = self.stats_file
+        if not source.exists():
+            legacy = source.with_suffix(".yaml")
+            if source.suffix != ".json" or not legacy.exists():
+                logger.info(
+                    "Usage stats file not found: %s, starting with empty stats",
+                    self.stats_file,
+                )
+                self.usage_counts = Counter()
+                return
+
+            # One-time migration from the old YAML stats file
+            logger.info("Migrating usage stats from %s", legacy)
+            source = legacy
 
         try:
-            with open(self.stats_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            with open(source, "rb") as f:
+                raw = f.read()
+
+            if source.suffix == ".json":
+                data = _json_loads(raw) if raw.strip() else None
+            else:
+                data = yaml_load(raw)
 
             if data is None:
                 logger.warning("Usage stats file is empty, starting with empty stats")
-                self.usage_counts = {}
+                self.usage_counts = Counter()
                 return
 
             if not isinstance(data, dict) or "snippet_usage" not in data:
                 logger.warning(
                     "Usage stats file has invalid structure, starting with empty stats"
                 )
-                self.usage_counts = {}
+                self.usage_counts = Counter()
                 return
 
             usage_data = data["snippet_usage"]
             if not isinstance(usage_data, dict):
-                logger.warning(
-                    "snippet_usage is not a dict, starting with empty stats"
-                )
-                self.usage_counts = {}
+                logger.warning("snippet_usage is not a dict, starting with empty stats")
+                self.usage_counts = Counter()
                 return
 
             # Validate all values are integers
@@ -87,20 +138,26 @@ class UsageTracker:
                     validated_counts[snippet_id] = count
                 else:
                     logger.warning(
-                        f"Invalid count for snippet {snippet_id}: {count}, skipping"
+                        "Invalid count for snippet %s: %s, skipping", snippet_id, count
                     )
 
-            self.usage_counts = validated_counts
+            self.usage_counts = Counter(validated_counts)
+            if source != self.stats_file:
+                self._dirty = True  # Write the migrated stats on next save
             logger.info(
-                f"Loaded {len(self.usage_counts)} usage stats from {self.stats_file}"
+                "Loaded %d usage stats from %s", len(self.usage_counts), self.stats_file
             )
 
-        except yaml.YAMLError as e:
-            logger.error(f"Failed to parse usage stats YAML: {e}, starting with empty stats")
-            self.usage_counts = {}
+        except (yaml.YAMLError, json.JSONDecodeError) as e:
+            logger.error(
+                "Failed to parse usage stats file: %s, starting with empty stats", e
+            )
+            self.usage_counts = Counter()
         except Exception as e:
-            logger.error(f"Unexpected error loading usage stats: {e}, starting with empty stats")
-            self.usage_counts = {}
+            logger.error(
+                "Unexpected error loading usage stats: %s, starting with empty stats", e
+            )
+            self.usage_counts = Counter()
 
     def increment(self, snippet_id: str):
         """
@@ -109,9 +166,38 @@ class UsageTracker:
         Args:
             snippet_id: ID of snippet to increment
         """
-        current_count = self.usage_counts.get(snippet_id, 0)
-        self.usage_counts[snippet_id] = current_count + 1
-        logger.debug(f"Incremented usage for {snippet_id} to {self.usage_counts[snippet_id]}")
+        with self._lock:
+            self.usage_counts[snippet_id] += 1
+            count = self.usage_counts[snippet_id]
+            self._dirty = True
+        logger.debug("Incremented usage for %s to %s", snippet_id, count)
+        self._schedule_save()
+
+    def increment_many(self, snippet_ids: Iterable[str]):
+        """
+        Increment usage counts for several snippets at once.
+
+        Args:
+            snippet_ids: IDs of snippets to increment (repeats count repeatedly)
+        """
+        snippet_ids = list(snippet_ids)
+        if snippet_ids:
+            with self._lock:
+                self.usage_counts.update(snippet_ids)
+                self._dirty = True
+        self._schedule_save()
+
+    def _schedule_save(self):
+        """(Re)start the debounced save timer, if debouncing is enabled."""
+        if self.save_debounce_s is None or not self._dirty:
+            return
+
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.save_debounce_s, self.save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
 
     def get_count(self, snippet_id: str) -> int:
         """
@@ -132,27 +218,67 @@ class UsageTracker:
         Returns:
             Dictionary mapping snippet IDs to usage counts (copy, not reference)
         """
-        return self.usage_counts.copy()
+        return dict(self.usage_counts)
 
     def save(self):
         """
         Save usage statistics to file.
 
-        Creates parent directory if it doesn't exist.
+        Creates parent directory if it doesn't exist. Does nothing when the
+        counts have not changed since the last successful save.
         """
-        try:
-            # Create parent directory if needed
-            self.stats_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                # Snapshot and mark clean together, so an increment made
+                # while the file is being written marks the tracker dirty again
+                data = {"snippet_usage": dict(self.usage_counts)}
+                self._dirty = False
+
+            try:
+                # Create parent directory if needed
+                self.stats_file.parent.mkdir(parents=True, exist_ok=True)
+
+                # Serialize (plain dict: encoders cannot represent Counter)
+                if self.stats_file.suffix == ".json":
+                    payload = _json_dumps(data)
+                else:
+                    payload = yaml_dump(
+                        data, default_flow_style=False, sort_keys=True
+                    ).encode("utf-8")
+
+                # Write to a temp file and atomically replace the stats file,
+                # so a crash mid-write never leaves a truncated file behind
+                tmp_file = self.stats_file.with_name(self.stats_file.name + ".tmp")
+                try:
+                    with open(tmp_file, "wb") as f:
+                        f.write(payload)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_file, self.stats_file)
+                except BaseException:
+                    tmp_file.unlink(missing_ok=True)
+                    raise
+
+                logger.info(
+                    "Saved %d usage stats to %s",
+                    len(data["snippet_usage"]),
+                    self.stats_file,
+                )
 
-            # Write to file
-            data = {"snippet_usage": self.usage_counts}
-            with open(self.stats_file, "w", encoding="utf-8") as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=True)
+            except Exception as e:
+                with self._lock:
+                    self._dirty = True
+                logger.error("Failed to save usage stats: %s", e)
 
-            logger.info(f"Saved {len(self.usage_counts)} usage stats to {self.stats_file}")
-
-        except Exception as e:
-            logger.error(f"Failed to save usage stats: {e}")
+    def flush(self):
+        """Cancel any pending debounced save and write changes immediately."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        self.save()
 
     def cleanup_orphaned(self, valid_snippet_ids: List[str]):
         """
@@ -161,12 +287,25 @@ class UsageTracker:
         Args:
             valid_snippet_ids: List of snippet IDs that currently exist
         """
-        valid_ids_set = set(valid_snippet_ids)
-        orphaned_ids = [sid for sid in self.usage_counts.keys() if sid not in valid_ids_set]
+        valid_ids = set(valid_snippet_ids)
+        with self._lock:
+            orphaned_ids = self.usage_counts.keys() - valid_ids
+            if not orphaned_ids:
+                return
 
-        for orphaned_id in orphaned_ids:
-            del self.usage_counts[orphaned_id]
-            logger.debug(f"Removed orphaned usage stat for {orphaned_id}")
+            if len(orphaned_ids) * 4 > len(self.usage_counts):
+                # Over a quarter orphaned: rebuild rather than delete key by key
+                self.usage_counts = Counter(
+                    {
+                        sid: count
+                        for sid, count in self.usage_counts.items()
+                        if sid not in orphaned_ids
+                    }
+                )
+            else:
+                for orphaned_id in orphaned_ids:
+                    del self.usage_counts[orphaned_id]
 
-        if orphaned_ids:
-            logger.info(f"Cleaned up {len(orphaned_ids)} orphaned usage stats")
+            self._dirty = True
+        logger.info("Cleaned up %d orphaned usage stats", len(orphaned_ids))
+        self._schedule_save()
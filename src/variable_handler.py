@@ -11,10 +11,30 @@ Variable names can contain any characters except curly braces.
 """
 
 import re
-from typing import Optional
+import sys
+from functools import lru_cache
+from typing import NamedTuple, Optional
 
+# Matches {{name}} or {{name:default}}, capturing name and default.
+# Neither part may contain braces, so {{{var}}} only matches {{var}}; the
+# default is split on the first colon only (e.g. "https://example.com").
+# Surrounding whitespace is matched outside the name group, which takes
+# non-space runs and only inner whitespace runs followed by more name.
+# Possessive quantifiers (++ / *+) never give characters back, so a failed
+# candidate such as an unclosed "{{..." is rejected without backtracking.
+_VAR_RE = re.compile(
+    r"\{\{\s*+((?:[^{}:\s]++|\s++(?=[^{}:\s]))*+)\s*+(?::([^{}]*+))?\}\}"
+)
 
-def detect_variables(content: str) -> list[dict[str, Optional[str]]]:
+
+class Variable(NamedTuple):
+    """A variable detected in snippet content."""
+
+    name: str
+    default: Optional[str] = None
+
+
+def detect_variables(content: str) -> list[Variable]:
     """
     Detect all variables in content and return their metadata.
 
@@ -22,8 +42,8 @@ def detect_variables(content: str) -> list[dict[str, Optional[str]]]:
         content: String content potentially containing variables
 
     Returns:
-        List of dictionaries with 'name' and 'default' keys.
-        Example: [{'name': 'app_name', 'default': 'app'}, {'name': 'port', 'default': None}]
+        List of Variable tuples with 'name' and 'default' fields.
+        Example: [Variable(name='app_name', default='app'), Variable(name='port', default=None)]
 
     Edge Cases:
         - Empty variable names {{}} are ignored
@@ -31,39 +51,147 @@ def detect_variables(content: str) -> list[dict[str, Optional[str]]]:
         - Duplicate variables are deduplicated (returns each unique variable once)
         - Nested braces: {{{var}}} will detect {{var}} as valid variable
     """
-    # Regex pattern to match {{...}}
-    # Use lookahead (?=...) to find ALL possible {{...}} patterns including overlapping ones
-    # [^{}]+ matches any characters EXCEPT braces - this ensures {{{var}}} only matches {{var}}
-    pattern = r"(?=\{\{([^{}]+)\}\})"
+    # Every variable starts with "{{"; plain text needs no regex scan
+    if "{{" not in content:
+        return []
 
-    # findall with lookahead returns only the captured groups
-    matches = re.findall(pattern, content)
+    # Shares the parse with substitute_variables via the template cache
+    return list(compile_template(content).variables)
 
-    variables = []
-    seen_names = set()
 
-    for match in matches:
-        # Parse variable name and optional default value
-        # Split on first colon only (to handle defaults like "https://example.com")
-        parts = match.split(":", 1)
-        var_name = parts[0].strip()
-
-        # Skip empty variable names
-        if not var_name:
-            continue
-
-        # Check if we've already seen this variable (deduplication)
-        if var_name in seen_names:
-            continue
+class CompiledTemplate:
+    """
+    Snippet content pre-split into literal text and variable slots.
 
-        seen_names.add(var_name)
+    Parsing happens once into a list of parts where literal text is already
+    in place and variables are slots to fill; render() copies the list,
+    fills only the slots and joins, with no regex work.
+    """
 
-        # Extract default value if present
-        default_value = parts[1] if len(parts) > 1 else None
+    __slots__ = ("parts", "slots", "defaults", "variables", "format_string")
+
+    def __init__(self, content: str):
+        """
+        Parse content into parts and slots.
+
+        Args:
+            content: String content potentially containing variables
+        """
+        # Literal text in place, None where a variable goes
+        parts = []
+        # (index into parts, variable name) for each variable occurrence
+        slots = []
+        # Default for each variable, taken from its first occurrence
+        defaults: dict[str, Optional[str]] = {}
+        # Whether every placeholder is a plain {{identifier}} without default
+        plain = True
+        placeholders = 0
+        pos = 0
+
+        for match in _VAR_RE.finditer(content):
+            placeholders += 1
+            var_name, default_value = match.groups()
+
+            # Empty variable names {{ }} stay in the literal text
+            if not var_name:
+                plain = False
+                continue
+
+            # Interned so lookups in values/defaults hit the identity fast path
+            var_name = sys.intern(var_name)
+
+            start, end = match.span()
+            if start > pos:
+                parts.append(content[pos:start])
+            slots.append((len(parts), var_name))
+            parts.append(None)
+            defaults.setdefault(var_name, default_value)
+            # Plain means exactly "{{" + identifier + "}}" (no padding/default)
+            if end - start != len(var_name) + 4 or not var_name.isidentifier():
+                plain = False
+            pos = end
+
+        if pos < len(content):
+            parts.append(content[pos:])
+
+        self.parts = parts
+        self.slots = tuple(slots)
+        self.defaults = defaults
+        # Unique variables in order of first appearance
+        self.variables = tuple(Variable(*item) for item in defaults.items())
+        self.format_string = (
+            self._to_format_string(content, placeholders)
+            if plain and defaults
+            else None
+        )
+
+    @staticmethod
+    def _to_format_string(content: str, placeholders: int) -> Optional[str]:
+        """
+        Convert content to a str.format_map template when that is safe.
+
+        Only called when every placeholder is a plain {{identifier}} without a
+        default; returns None if content has any other braces.
+        """
+        # Any brace outside a placeholder would be misread by str.format
+        braces = 2 * placeholders
+        if content.count("{") != braces or content.count("}") != braces:
+            return None
+
+        return content.replace("{{", "{").replace("}}", "}")
+
+    def render(self, values: dict[str, str]) -> str:
+        """
+        Fill the template with provided or default values.
+
+        Args:
+            values: Dictionary mapping variable names to replacement values
+
+        Returns:
+            Content with all variables replaced
+
+        Raises:
+            ValueError: If a variable has neither a value nor a default
+        """
+        # Fast path: plain {{name}} placeholders are filled by str.format_map
+        if self.format_string is not None:
+            try:
+                return self.format_string.format_map(values)
+            except KeyError as e:
+                raise ValueError(
+                    f"No value provided for variable '{e.args[0]}' and no default specified"
+                ) from None
+
+        parts = self.parts.copy()
+        for index, var_name in self.slots:
+            if var_name in values:
+                # Use provided value
+                parts[index] = values[var_name]
+            else:
+                # Use default value
+                default_value = self.defaults[var_name]
+                if default_value is None:
+                    # No value provided and no default - error
+                    raise ValueError(
+                        f"No value provided for variable '{var_name}' and no default specified"
+                    )
+                parts[index] = default_value
+
+        return "".join(parts)
+
+
+@lru_cache(maxsize=512)
+def compile_template(content: str) -> CompiledTemplate:
+    """
+    Parse content into a reusable CompiledTemplate (cached per content).
 
-        variables.append({"name": var_name, "default": default_value})
+    Args:
+        content: String content potentially containing variables
 
-    return variables
+    Returns:
+        CompiledTemplate for content
+    """
+    return CompiledTemplate(content)
 
 
 def substitute_variables(content: str, values: dict[str, str]) -> str:
@@ -87,39 +215,16 @@ def substitute_variables(content: str, values: dict[str, str]) -> str:
         - Multiple occurrences of same variable are all replaced
         - Invalid variable names are left as-is (not substituted)
     """
-    # First, detect all variables to understand what we're working with
-    variables = detect_variables(content)
-
-    # Build complete substitution map (provided values + defaults)
-    substitutions = {}
-
-    for var in variables:
-        var_name = var["name"]
-
-        if var_name in values:
-            # Use provided value
-            substitutions[var_name] = values[var_name]
-        elif var["default"] is not None:
-            # Use default value
-            substitutions[var_name] = var["default"]
-        else:
-            # No value provided and no default - error
-            raise ValueError(
-                f"No value provided for variable '{var_name}' and no default specified"
-            )
+    if "{{" not in content:
+        return content
 
-    # Perform substitution
-    # We need to handle both {{var}} and {{var:default}} forms
-    result = content
+    template = compile_template(content)
 
-    for var_name, replacement_value in substitutions.items():
-        # Pattern to match {{var_name}} or {{var_name:anything}}
-        # Use word boundaries and escape the variable name for regex safety
-        pattern = r"\{\{" + re.escape(var_name) + r"(?::[^}]*)?\}\}"
-        # Use lambda to avoid backslash interpretation in replacement string
-        result = re.sub(pattern, lambda m: replacement_value, result)
+    # Nothing to substitute (e.g. only {{ }}): hand back the input unchanged
+    if not template.slots:
+        return content
 
-    return result
+    return template.render(values)
 
 
 class VariableHandler:
@@ -129,7 +234,7 @@ class VariableHandler:
     Provides object-oriented interface to detect_variables and substitute_variables.
     """
 
-    def detect_variables(self, content: str) -> list[dict[str, Optional[str]]]:
+    def detect_variables(self, content: str) -> list[Variable]:
         """Detect variables in content."""
         return detect_variables(content)
 
@@ -6,14 +6,17 @@ snippet variables during the copy operation.
 
 Classes:
     VariablePromptDialog: Modal dialog for single variable input
+    MultiVariablePromptDialog: Modal form dialog for all variables at once
 
 Functions:
-    prompt_for_variables: Show sequential prompts for multiple variables
+    prompt_for_variables: Prompt for multiple variables in one dialog
 """
 
+import weakref
 from typing import List, Optional, Dict
 from PySide6.QtWidgets import (
     QDialog,
+    QFormLayout,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
@@ -23,6 +26,8 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
+from src.variable_handler import Variable
+
 
 class VariablePromptDialog(QDialog):
     """
@@ -118,39 +123,166 @@ class VariablePromptDialog(QDialog):
         return None
 
 
+class MultiVariablePromptDialog(QDialog):
+    """
+    Modal dialog for entering values for several variables at once.
+
+    Features:
+    - One labelled input row per variable in a form layout
+    - Pre-populates default values where provided
+    - Validates that every field is non-empty
+    - Returns None on cancel, dict of values on OK
+    """
+
+    def __init__(self, variables: List[Variable], parent=None):
+        """
+        Initialize multi-variable prompt dialog.
+
+        Args:
+            variables: List of Variable tuples (name, default) to prompt for
+            parent: Parent widget for modal behavior
+        """
+        super().__init__(parent)
+        self.variables = variables
+        self.values = None
+        self.input_fields: Dict[str, QLineEdit] = {}
+        self._setup_ui()
+        self.reset(variables)
+
+    def _setup_ui(self):
+        """Create and configure UI components."""
+        self.setWindowTitle("Variable Input")
+        self.setModal(True)
+        self.setMinimumWidth(400)
+
+        # Main layout
+        layout = QVBoxLayout()
+
+        # One row per variable (filled in by reset)
+        self.form_layout = QFormLayout()
+        layout.addLayout(self.form_layout)
+
+        # Button layout (Cancel, OK)
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(self.cancel_button)
+
+        self.ok_button = QPushButton("OK")
+        self.ok_button.setDefault(True)
+        self.ok_button.clicked.connect(self._on_ok)
+        button_layout.addWidget(self.ok_button)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def reset(self, variables: List[Variable]):
+        """
+        Reconfigure the form for a new set of variables.
+
+        Existing rows are relabelled and reused; surplus rows are removed.
+
+        Args:
+            variables: List of Variable tuples (name, default) to prompt for
+        """
+        self.variables = variables
+        self.values = None
+
+        form_layout = self.form_layout
+        while form_layout.rowCount() > len(variables):
+            form_layout.removeRow(form_layout.rowCount() - 1)
+
+        self.input_fields = {}
+        for row, (var_name, var_default) in enumerate(variables):
+            if row < form_layout.rowCount():
+                label = form_layout.itemAt(row, QFormLayout.ItemRole.LabelRole).widget()
+                input_field = form_layout.itemAt(
+                    row, QFormLayout.ItemRole.FieldRole
+                ).widget()
+            else:
+                label = QLabel()
+                input_field = QLineEdit()
+                input_field.setPlaceholderText("Enter value...")
+                form_layout.addRow(label, input_field)
+
+            # Name label + input field with default value
+            label.setText(f"{var_name}:")
+            input_field.setText(var_default or "")
+            self.input_fields[var_name] = input_field
+
+        if self.input_fields:
+            next(iter(self.input_fields.values())).setFocus()
+        self.adjustSize()
+
+    def _on_ok(self):
+        """Validate all inputs and accept if none are empty."""
+        values = {}
+        for var_name, input_field in self.input_fields.items():
+            value = input_field.text().strip()
+            if not value:
+                QMessageBox.warning(
+                    self,
+                    "Error",
+                    f"A value for '{var_name}' is required. Please enter a value.",
+                )
+                input_field.setFocus()
+                return
+            values[var_name] = value
+
+        self.values = values
+        self.accept()
+
+    def get_values(self) -> Optional[Dict[str, str]]:
+        """
+        Execute dialog and return user-entered values.
+
+        Returns:
+            Dict mapping variable names to values if OK clicked, None if cancelled
+        """
+        result = self.exec()
+        if result == QDialog.DialogCode.Accepted:
+            return self.values
+        return None
+
+
+# One reusable form dialog per parent widget; entries go away with the parent
+_dialog_pool = weakref.WeakKeyDictionary()
+
+
 def prompt_for_variables(
-    variables: List[Dict[str, Optional[str]]], parent=None
+    variables: List[Variable], parent=None
 ) -> Optional[Dict[str, str]]:
     """
-    Show sequential prompts for each variable.
+    Prompt for all variables in a single modal form.
 
     Args:
-        variables: List of dicts with 'name' and optional 'default' keys
-            Example: [{'name': 'filepath', 'default': None}, {'name': 'port', 'default': '5000'}]
+        variables: List of Variable tuples (name, default) from detect_variables
+            Example: [Variable('filepath', None), Variable('port', '5000')]
         parent: Parent widget for modal dialogs
 
     Returns:
-        Dict mapping variable names to user-entered values, or None if user cancels any prompt
+        Dict mapping variable names to user-entered values, or None if user cancels
 
     Example:
-        >>> variables = [{'name': 'path', 'default': None}, {'name': 'port', 'default': '8080'}]
+        >>> variables = [Variable('path'), Variable('port', '8080')]
         >>> values = prompt_for_variables(variables)
         >>> if values:
         ...     print(values)  # {'path': '/home/user', 'port': '8080'}
     """
-    values = {}
-
-    for var in variables:
-        var_name = var["name"]
-        var_default = var.get("default")
-
-        dialog = VariablePromptDialog(var_name, var_default, parent)
-        value = dialog.get_value()
-
-        if value is None:
-            # User cancelled - abort entire operation
-            return None
-
-        values[var_name] = value
-
-    return values
+    if not variables:
+        return {}
+
+    if parent is None:
+        dialog = MultiVariablePromptDialog(variables, parent)
+    else:
+        # Reuse the parent's dialog rather than rebuilding the widgets
+        dialog = _dialog_pool.get(parent)
+        if dialog is None:
+            dialog = MultiVariablePromptDialog(variables, parent)
+            _dialog_pool[parent] = dialog
+        else:
+            dialog.reset(variables)
+
+    return dialog.get_values()
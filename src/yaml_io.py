@@ -0,0 +1,46 @@
+"""
+YAML I/O Helpers
+
+Shared load/dump helpers that use the libyaml-backed C loader and dumper
+when PyYAML was built with them, falling back to the pure-Python safe
+implementations otherwise.
+"""
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
+
+
+def yaml_load(stream):
+    """
+    Parse a YAML document with the fastest available safe loader.
+
+    Args:
+        stream: Open file handle (text or binary) or YAML string
+
+    Returns:
+        Parsed Python object (None for an empty document)
+
+    Raises:
+        yaml.YAMLError: If the document is malformed
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def yaml_dump(data, stream=None, Dumper=SafeDumper, **kwargs):
+    """
+    Serialize data with the fastest available safe dumper.
+
+    Args:
+        data: Python object to serialize (plain dicts, lists, scalars, dates)
+        stream: Open file handle to write to (returns a string if None)
+        Dumper: Dumper class (a SafeDumper subclass with extra representers)
+        **kwargs: Extra options passed through to yaml.dump
+
+    Returns:
+        Serialized YAML if stream is None, otherwise None
+    """
+    return yaml.dump(data, stream, Dumper=Dumper, **kwargs)
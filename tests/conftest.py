@@ -0,0 +1,23 @@
+"""
+Shared pytest fixtures for the test suite
+"""
+
+import pytest
+import sys
+from PySide6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def qt_app():
+    """
+    Create one QApplication instance shared by every Qt test.
+
+    Under pytest-xdist each worker is its own process, so each worker gets
+    its own instance.
+    """
+    # Reuse an existing instance (e.g. one created by pytest-qt); never quit
+    # it here, the interpreter exit tears it down
+    app_instance = QApplication.instance()
+    if app_instance is None:
+        app_instance = QApplication(sys.argv if sys.argv else [])
+    yield app_instance
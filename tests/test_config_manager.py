@@ -12,60 +12,99 @@ import pytest
 from pathlib import Path
 import yaml
 import tempfile
+import itertools
+import json
 import os
 
+from src.config_manager import ConfigManager
+from src.yaml_io import yaml_dump
+
+# Config files used across tests, serialized once at import time
+FIXTURES = {
+    "valid_full": yaml_dump(
+        {
+            "hotkey": "ctrl+alt+s",
+            "snippet_file": "C:\\Users\\test\\snippets.yaml",
+            "max_results": 15,
+            "overlay_opacity": 0.85,
+            "theme": "light",
+            "fuzzy_threshold": 70,
+            "search_debounce_ms": 200,
+            "auto_reload": False,
+            "run_on_startup": True,
+            "overlay_width": 800,
+            "overlay_height": 500,
+        }
+    ),
+    "malformed": 'invalid: yaml: content:\n  - broken\n  missing_quote: "unclosed',
+    "partial": yaml_dump({"hotkey": "alt+space", "max_results": 20, "theme": "light"}),
+    "unknown_keys": yaml_dump(
+        {
+            "hotkey": "ctrl+space",
+            "custom_field": "custom_value",
+            "another_unknown": 42,
+            "max_results": 15,
+        }
+    ),
+    "wrong_types": yaml_dump(
+        {
+            "max_results": "ten",  # Should be int
+            "overlay_opacity": "high",  # Should be float
+        }
+    ),
+}
+
+
+def _y1(key, value):
+    """Serialize a single-key config; JSON scalars are valid YAML flow scalars."""
+    return f"{key}: {json.dumps(value)}\n"
+
+
+@pytest.fixture
+def write_config(tmp_path):
+    """Return a callable that writes a config (dict or raw YAML) and returns its path."""
+    counter = itertools.count()
+
+    def _write(data):
+        # A fresh name per write: rewriting one file in place could keep the
+        # same size and mtime tick, and the parse cache would serve stale data
+        path = tmp_path / f"config_{next(counter)}.yaml"
+        if isinstance(data, dict) and len(data) == 1:
+            data = _y1(*next(iter(data.items())))
+        path.write_text(data if isinstance(data, str) else yaml_dump(data))
+        return str(path)
+
+    return _write
+
 
 class TestConfigLoading:
     """Test configuration loading from files"""
 
-    def test_load_valid_config(self):
+    def test_load_valid_config(self, tmp_path):
         """Load configuration from valid YAML file"""
-        from src.config_manager import ConfigManager
-
         # Create temporary valid config file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            config_path = f.name
-            yaml.dump(
-                {
-                    "hotkey": "ctrl+alt+s",
-                    "snippet_file": "C:\\Users\\test\\snippets.yaml",
-                    "max_results": 15,
-                    "overlay_opacity": 0.85,
-                    "theme": "light",
-                    "fuzzy_threshold": 70,
-                    "search_debounce_ms": 200,
-                    "auto_reload": False,
-                    "run_on_startup": True,
-                    "overlay_width": 800,
-                    "overlay_height": 500,
-                },
-                f,
-            )
-
-        try:
-            # Load config
-            manager = ConfigManager(config_path)
-            config = manager.config
-
-            # Verify all 11 values loaded correctly
-            assert config["hotkey"] == "ctrl+alt+s"
-            assert config["snippet_file"] == "C:\\Users\\test\\snippets.yaml"
-            assert config["max_results"] == 15
-            assert config["overlay_opacity"] == 0.85
-            assert config["theme"] == "light"
-            assert config["fuzzy_threshold"] == 70
-            assert config["search_debounce_ms"] == 200
-            assert config["auto_reload"] is False
-            assert config["run_on_startup"] is True
-            assert config["overlay_width"] == 800
-            assert config["overlay_height"] == 500
-        finally:
-            os.unlink(config_path)
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(FIXTURES["valid_full"])
+
+        # Load config
+        manager = ConfigManager(config_path)
+        config = manager.config
+
+        # Verify all 11 values loaded correctly
+        assert config["hotkey"] == "ctrl+alt+s"
+        assert config["snippet_file"] == "C:\\Users\\test\\snippets.yaml"
+        assert config["max_results"] == 15
+        assert config["overlay_opacity"] == 0.85
+        assert config["theme"] == "light"
+        assert config["fuzzy_threshold"] == 70
+        assert config["search_debounce_ms"] == 200
+        assert config["auto_reload"] is False
+        assert config["run_on_startup"] is True
+        assert config["overlay_width"] == 800
+        assert config["overlay_height"] == 500
 
     def test_load_missing_config_creates_default(self):
         """When config file missing, create default config.yaml"""
-        from src.config_manager import ConfigManager
-
         # Create path to non-existent config file
         with tempfile.TemporaryDirectory() as tmpdir:
             config_path = Path(tmpdir) / "config.yaml"
@@ -95,263 +134,225 @@ class TestConfigLoading:
             assert config["overlay_width"] == 600
             assert config["overlay_height"] == 400
 
-    def test_load_invalid_yaml_config(self):
+    def test_load_invalid_yaml_config(self, tmp_path):
         """When config YAML is malformed, fall back to defaults"""
-        from src.config_manager import ConfigManager
-
         # Create malformed YAML file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            config_path = f.name
-            f.write('invalid: yaml: content:\n  - broken\n  missing_quote: "unclosed')
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(FIXTURES["malformed"])
 
-        try:
-            # Load should fall back to defaults
-            manager = ConfigManager(config_path)
-            config = manager.config
+        # Load should fall back to defaults
+        manager = ConfigManager(config_path)
+        config = manager.config
 
-            # Verify defaults are used
-            assert config["hotkey"] == "ctrl+shift+space"
-            assert config["max_results"] == 10
-            assert config["theme"] == "dark"
-        finally:
-            os.unlink(config_path)
+        # Verify defaults are used
+        assert config["hotkey"] == "ctrl+shift+space"
+        assert config["max_results"] == 10
+        assert config["theme"] == "dark"
 
-    def test_missing_fields_use_defaults(self):
+    def test_missing_fields_use_defaults(self, tmp_path):
         """Partial config files should merge with defaults"""
-        from src.config_manager import ConfigManager
-
         # Create partial config with only 3 fields
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            config_path = f.name
-            yaml.dump({"hotkey": "alt+space", "max_results": 20, "theme": "light"}, f)
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(FIXTURES["partial"])
+
+        # Load should merge with defaults
+        manager = ConfigManager(config_path)
+        config = manager.config
+
+        # Verify custom values
+        assert config["hotkey"] == "alt+space"
+        assert config["max_results"] == 20
+        assert config["theme"] == "light"
+
+        # Verify other 8 fields use defaults
+        assert "snippets.yaml" in config["snippet_file"]
+        assert config["overlay_opacity"] == 0.95
+        assert config["fuzzy_threshold"] == 60
+        assert config["search_debounce_ms"] == 150
+        assert config["auto_reload"] is True
+        assert config["run_on_startup"] is False
+        assert config["overlay_width"] == 600
+        assert config["overlay_height"] == 400
+
+    def test_unchanged_config_parsed_once(self):
+        """Managers for an unchanged file reuse the cached parse"""
+        from unittest.mock import patch
 
-        try:
-            # Load should merge with defaults
-            manager = ConfigManager(config_path)
-            config = manager.config
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config_path.write_text(_y1("hotkey", "alt+space"))
 
-            # Verify custom values
-            assert config["hotkey"] == "alt+space"
-            assert config["max_results"] == 20
-            assert config["theme"] == "light"
+            manager = ConfigManager(str(config_path))
+            manager.set("hotkey", "ctrl+k")
 
-            # Verify other 8 fields use defaults
-            assert "snippets.yaml" in config["snippet_file"]
-            assert config["overlay_opacity"] == 0.95
-            assert config["fuzzy_threshold"] == 60
-            assert config["search_debounce_ms"] == 150
-            assert config["auto_reload"] is True
-            assert config["run_on_startup"] is False
-            assert config["overlay_width"] == 600
-            assert config["overlay_height"] == 400
-        finally:
-            os.unlink(config_path)
+            with patch("src.config_manager.yaml_load") as mock_load:
+                manager2 = ConfigManager(str(config_path))
+                mock_load.assert_not_called()
+
+            # set() on the first manager must not leak into the cache
+            assert manager2.get("hotkey") == "alt+space"
+
+    def test_sidecar_skips_yaml_parse_on_next_run(self, tmp_path):
+        """A fresh process reuses the JSON sidecar until the file changes"""
+        from unittest.mock import patch
+        from src import config_manager
+
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(FIXTURES["partial"])
+        ConfigManager(str(config_path))
+        assert (tmp_path / "config.yaml.cache").exists()
+
+        # Simulate a new run: the in-process parse cache starts empty
+        config_manager._YAML_CACHE.clear()
+        with patch("src.config_manager.yaml_load") as mock_load:
+            manager = ConfigManager(str(config_path))
+            mock_load.assert_not_called()
+        assert manager.get("hotkey") == "alt+space"
+
+        # Editing the file invalidates the sidecar
+        config_path.write_text(yaml.dump({"hotkey": "ctrl+k", "theme": "system"}))
+        config_manager._YAML_CACHE.clear()
+        assert ConfigManager(str(config_path)).get("hotkey") == "ctrl+k"
 
 
 class TestConfigValidation:
     """Test configuration value validation"""
 
-    def test_validate_hotkey_format(self):
-        """Validate hotkey format (ctrl|shift|alt)+...+key"""
-        from src.config_manager import ConfigManager
-
-        # Test valid hotkey patterns
-        valid_hotkeys = [
+    @pytest.mark.parametrize(
+        "hotkey",
+        [
             "ctrl+shift+space",
             "alt+f1",
             "ctrl+alt+shift+k",
             "shift+enter",
             "ctrl+f12",
             "alt+shift+a",
-        ]
-
-        for hotkey in valid_hotkeys:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".yaml", delete=False
-            ) as f:
-                config_path = f.name
-                yaml.dump({"hotkey": hotkey}, f)
-
-            try:
-                manager = ConfigManager(config_path)
-                is_valid, errors = manager.validate()
-                assert is_valid, f"Hotkey '{hotkey}' should be valid, errors: {errors}"
-            finally:
-                os.unlink(config_path)
-
-        # Test invalid hotkey patterns
-        invalid_hotkeys = [
+        ],
+    )
+    def test_validate_hotkey_format(self, write_config, hotkey):
+        """Validate hotkey format (ctrl|shift|alt)+...+key"""
+        manager = ConfigManager(write_config({"hotkey": hotkey}))
+        is_valid, errors = manager.validate()
+        assert is_valid, f"Hotkey '{hotkey}' should be valid, errors: {errors}"
+
+    @pytest.mark.parametrize(
+        "hotkey, reason",
+        [
             ("space", "no modifier"),
             ("k", "no modifier"),
             ("ctrl+ctrl+k", "duplicate modifier"),
             ("shift+shift+a", "duplicate modifier"),
             ("invalid+k", "unknown modifier"),
             ("", "empty hotkey"),
-        ]
-
-        for hotkey, reason in invalid_hotkeys:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".yaml", delete=False
-            ) as f:
-                config_path = f.name
-                yaml.dump({"hotkey": hotkey}, f)
-
-            try:
-                manager = ConfigManager(config_path)
-                is_valid, errors = manager.validate()
-                assert not is_valid, f"Hotkey '{hotkey}' should be invalid ({reason})"
-                assert len(errors) > 0
-            finally:
-                os.unlink(config_path)
-
-    def test_validate_file_path(self):
-        """Validate snippet file path is non-empty"""
-        from src.config_manager import ConfigManager
-
-        # Valid paths
-        valid_paths = [
+        ],
+    )
+    def test_validate_invalid_hotkey_format(self, write_config, hotkey, reason):
+        """Reject hotkeys without a valid, unique modifier"""
+        manager = ConfigManager(write_config({"hotkey": hotkey}))
+        is_valid, errors = manager.validate()
+        assert not is_valid, f"Hotkey '{hotkey}' should be invalid ({reason})"
+        assert len(errors) > 0
+
+    @pytest.mark.parametrize(
+        "path",
+        [
             "C:\\Users\\test\\snippets.yaml",
             "/home/user/snippets.yaml",
             "snippets.yaml",
             "../config/snippets.yaml",
-        ]
-
-        for path in valid_paths:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".yaml", delete=False
-            ) as f:
-                config_path = f.name
-                yaml.dump({"snippet_file": path}, f)
-
-            try:
-                manager = ConfigManager(config_path)
-                is_valid, errors = manager.validate()
-                assert is_valid, f"Path '{path}' should be valid, errors: {errors}"
-            finally:
-                os.unlink(config_path)
-
-        # Invalid paths
-        invalid_paths = ["", "   ", None]
-
-        for path in invalid_paths:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".yaml", delete=False
-            ) as f:
-                config_path = f.name
-                yaml.dump({"snippet_file": path}, f)
-
-            try:
-                manager = ConfigManager(config_path)
-                is_valid, errors = manager.validate()
-                assert not is_valid, f"Path '{path}' should be invalid"
-                assert len(errors) > 0
-            finally:
-                os.unlink(config_path)
-
-    def test_validate_numeric_ranges(self):
+        ],
+    )
+    def test_validate_file_path(self, write_config, path):
+        """Validate snippet file path is non-empty"""
+        manager = ConfigManager(write_config({"snippet_file": path}))
+        is_valid, errors = manager.validate()
+        assert is_valid, f"Path '{path}' should be valid, errors: {errors}"
+
+    @pytest.mark.parametrize("path", ["", "   ", None, 42])
+    def test_validate_invalid_file_path(self, write_config, path):
+        """Reject empty, missing or non-string snippet file paths"""
+        manager = ConfigManager(write_config({"snippet_file": path}))
+        is_valid, errors = manager.validate()
+        assert not is_valid, f"Path '{path}' should be invalid"
+        assert errors == ["Snippet file path cannot be empty"]
+
+    @pytest.mark.parametrize(
+        "field, value, expected_valid",
+        [
+            # (field, value, valid?) - one valid, one too low, one too high
+            ("max_results", 10, True),
+            ("max_results", 3, False),
+            ("max_results", 25, False),
+            ("fuzzy_threshold", 60, True),
+            ("fuzzy_threshold", 30, False),
+            ("fuzzy_threshold", 90, False),
+            ("search_debounce_ms", 150, True),
+            ("search_debounce_ms", 20, False),
+            ("search_debounce_ms", 600, False),
+            ("overlay_opacity", 0.9, True),
+            ("overlay_opacity", 0.5, False),
+            ("overlay_opacity", 1.1, False),
+            ("overlay_width", 600, True),
+            ("overlay_width", 300, False),
+            ("overlay_width", 1500, False),
+            ("overlay_height", 400, True),
+            ("overlay_height", 200, False),
+            ("overlay_height", 900, False),
+        ],
+    )
+    def test_validate_numeric_ranges(self, write_config, field, value, expected_valid):
         """Validate numeric settings are within allowed ranges"""
-        from src.config_manager import ConfigManager
-
-        # Test each numeric setting
-        test_cases = [
-            # (field, valid_value, invalid_low, invalid_high)
-            ("max_results", 10, 3, 25),
-            ("fuzzy_threshold", 60, 30, 90),
-            ("search_debounce_ms", 150, 20, 600),
-            ("overlay_opacity", 0.9, 0.5, 1.1),
-            ("overlay_width", 600, 300, 1500),
-            ("overlay_height", 400, 200, 900),
-        ]
-
-        for field, valid_val, invalid_low, invalid_high in test_cases:
-            # Test valid value
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".yaml", delete=False
-            ) as f:
-                config_path = f.name
-                yaml.dump({field: valid_val}, f)
-
-            try:
-                manager = ConfigManager(config_path)
-                is_valid, errors = manager.validate()
-                assert (
-                    is_valid
-                ), f"{field}={valid_val} should be valid, errors: {errors}"
-            finally:
-                os.unlink(config_path)
-
-            # Test invalid low value
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".yaml", delete=False
-            ) as f:
-                config_path = f.name
-                yaml.dump({field: invalid_low}, f)
-
-            try:
-                manager = ConfigManager(config_path)
-                is_valid, errors = manager.validate()
-                assert (
-                    not is_valid
-                ), f"{field}={invalid_low} should be invalid (too low)"
-                assert any(field in err for err in errors)
-            finally:
-                os.unlink(config_path)
-
-            # Test invalid high value
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".yaml", delete=False
-            ) as f:
-                config_path = f.name
-                yaml.dump({field: invalid_high}, f)
-
-            try:
-                manager = ConfigManager(config_path)
-                is_valid, errors = manager.validate()
-                assert (
-                    not is_valid
-                ), f"{field}={invalid_high} should be invalid (too high)"
-                assert any(field in err for err in errors)
-            finally:
-                os.unlink(config_path)
-
-    def test_validate_theme_options(self):
+        manager = ConfigManager(write_config({field: value}))
+        is_valid, errors = manager.validate()
+        if expected_valid:
+            assert is_valid, f"{field}={value} should be valid, errors: {errors}"
+        else:
+            assert not is_valid, f"{field}={value} should be invalid (out of range)"
+            assert any(field in err for err in errors)
+
+    @pytest.mark.parametrize("theme", ["dark", "light", "system"])
+    def test_validate_theme_options(self, write_config, theme):
         """Validate theme is one of: dark, light, system"""
-        from src.config_manager import ConfigManager
-
-        # Valid themes
-        valid_themes = ["dark", "light", "system"]
-
-        for theme in valid_themes:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".yaml", delete=False
-            ) as f:
-                config_path = f.name
-                yaml.dump({"theme": theme}, f)
-
-            try:
-                manager = ConfigManager(config_path)
-                is_valid, errors = manager.validate()
-                assert is_valid, f"Theme '{theme}' should be valid, errors: {errors}"
-            finally:
-                os.unlink(config_path)
-
-        # Invalid themes
-        invalid_themes = ["blue", "custom", "auto", ""]
-
-        for theme in invalid_themes:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".yaml", delete=False
-            ) as f:
-                config_path = f.name
-                yaml.dump({"theme": theme}, f)
-
-            try:
-                manager = ConfigManager(config_path)
-                is_valid, errors = manager.validate()
-                assert not is_valid, f"Theme '{theme}' should be invalid"
-                assert any("theme" in err.lower() for err in errors)
-            finally:
-                os.unlink(config_path)
+        manager = ConfigManager(write_config({"theme": theme}))
+        is_valid, errors = manager.validate()
+        assert is_valid, f"Theme '{theme}' should be valid, errors: {errors}"
+
+    @pytest.mark.parametrize("theme", ["blue", "custom", "auto", ""])
+    def test_validate_invalid_theme_options(self, write_config, theme):
+        """Reject themes other than dark, light, system"""
+        manager = ConfigManager(write_config({"theme": theme}))
+        is_valid, errors = manager.validate()
+        assert not is_valid, f"Theme '{theme}' should be invalid"
+        assert any("theme" in err.lower() for err in errors)
+
+    def test_validate_result_reused_until_set(self, write_config):
+        """validate() is cached per config contents and invalidated by set()"""
+        from unittest.mock import patch
+
+        manager = ConfigManager(write_config({"theme": "blue"}))
+        is_valid, errors = manager.validate()
+        assert not is_valid
+        errors.clear()  # Caller mutation must not leak into the cache
+
+        with patch.object(manager, "_validate_hotkey") as mock_hotkey:
+            is_valid, errors = manager.validate()
+            mock_hotkey.assert_not_called()
+        assert not is_valid
+        assert any("theme" in err.lower() for err in errors)
+
+        manager.set("theme", "light")
+        assert manager.validate() == (True, [])
+
+    def test_validate_sees_direct_config_edits(self, write_config):
+        """validate() re-checks after values are assigned on manager.config"""
+        manager = ConfigManager(write_config({}))
+        assert manager.validate() == (True, [])
+
+        manager.config["max_results"] = -1
+
+        is_valid, errors = manager.validate()
+        assert not is_valid
+        assert any("max_results" in err for err in errors)
 
 
 class TestConfigPersistence:
@@ -359,8 +360,6 @@ class TestConfigPersistence:
 
     def test_save_config(self):
         """Save modified configuration to disk"""
-        from src.config_manager import ConfigManager
-
         # Create initial config
         with tempfile.TemporaryDirectory() as tmpdir:
             config_path = Path(tmpdir) / "config.yaml"
@@ -388,10 +387,61 @@ class TestConfigPersistence:
             assert manager2.get("fuzzy_threshold") == 60
             assert manager2.get("auto_reload") is True
 
+    def test_save_skipped_when_unchanged(self):
+        """save() does not rewrite the file when nothing changed"""
+        from unittest.mock import patch
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            manager = ConfigManager(str(config_path))
+
+            # Setting a value to what it already is does not dirty the config
+            manager.set("hotkey", "ctrl+shift+space")
+
+            with patch("src.config_manager.os.replace") as mock_replace:
+                manager.save()
+                mock_replace.assert_not_called()
+
+            manager.set("hotkey", "alt+f2")
+            manager.save()
+            assert ConfigManager(str(config_path)).get("hotkey") == "alt+f2"
+
+    def test_save_writes_direct_config_edits(self):
+        """save() persists values assigned directly on manager.config"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            manager = ConfigManager(str(config_path))
+
+            manager.config["hotkey"] = "alt+f3"
+            manager.save()
+
+            assert ConfigManager(str(config_path)).get("hotkey") == "alt+f3"
+
+    def test_save_repairs_malformed_config(self):
+        """save() rewrites a config file that fell back to defaults"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config_path.write_text("hotkey: [unclosed\n")
+            manager = ConfigManager(str(config_path))
+
+            manager.save()
+
+            saved = yaml.safe_load(config_path.read_text())
+            assert saved["hotkey"] == "ctrl+shift+space"
+
+    def test_save_recreates_deleted_config(self):
+        """save() writes the config again if the file was deleted after load"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            manager = ConfigManager(str(config_path))
+            config_path.unlink()
+
+            manager.save()
+
+            assert config_path.exists()
+
     def test_get_set_config_values(self):
         """Get and set individual config values"""
-        from src.config_manager import ConfigManager
-
         with tempfile.TemporaryDirectory() as tmpdir:
             config_path = Path(tmpdir) / "config.yaml"
             manager = ConfigManager(str(config_path))
@@ -419,76 +469,57 @@ class TestConfigPersistence:
 class TestConfigEdgeCases:
     """Test edge cases and error handling"""
 
-    def test_config_with_unknown_keys(self):
+    def test_config_with_unknown_keys(self, tmp_path):
         """Unknown keys in config file should be preserved"""
-        from src.config_manager import ConfigManager
-
         # Create config with known and unknown keys
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            config_path = f.name
-            yaml.dump(
-                {
-                    "hotkey": "ctrl+space",
-                    "custom_field": "custom_value",
-                    "another_unknown": 42,
-                    "max_results": 15,
-                },
-                f,
-            )
-
-        try:
-            # Load config
-            manager = ConfigManager(config_path)
-
-            # Verify known keys work
-            assert manager.get("hotkey") == "ctrl+space"
-            assert manager.get("max_results") == 15
-
-            # Verify unknown keys are preserved
-            assert manager.get("custom_field") == "custom_value"
-            assert manager.get("another_unknown") == 42
-
-            # Save and reload to verify persistence
-            manager.save()
-            manager2 = ConfigManager(config_path)
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(FIXTURES["unknown_keys"])
 
-            # Unknown keys should still be there
-            assert manager2.get("custom_field") == "custom_value"
-            assert manager2.get("another_unknown") == 42
-        finally:
-            os.unlink(config_path)
+        # Load config
+        manager = ConfigManager(config_path)
 
-    def test_empty_config_file(self):
-        """Empty config file should use all defaults"""
-        from src.config_manager import ConfigManager
+        # Verify known keys work
+        assert manager.get("hotkey") == "ctrl+space"
+        assert manager.get("max_results") == 15
+
+        # Verify unknown keys are preserved
+        assert manager.get("custom_field") == "custom_value"
+        assert manager.get("another_unknown") == 42
 
+        # Change a value so save() writes, then reload to verify persistence
+        manager.set("max_results", 20)
+        manager.save()
+        manager2 = ConfigManager(config_path)
+
+        # Unknown keys should still be there alongside the saved change
+        assert manager2.get("max_results") == 20
+        assert manager2.get("custom_field") == "custom_value"
+        assert manager2.get("another_unknown") == 42
+
+    def test_empty_config_file(self, tmp_path):
+        """Empty config file should use all defaults"""
         # Create empty YAML file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            config_path = f.name
-            f.write("")  # Empty file
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("")  # Empty file
 
-        try:
-            # Load should use all defaults
-            manager = ConfigManager(config_path)
+        # Load should use all defaults
+        manager = ConfigManager(config_path)
 
-            # Verify all 11 defaults are present
-            assert manager.get("hotkey") == "ctrl+shift+space"
-            assert "snippets.yaml" in manager.get("snippet_file")
-            assert manager.get("max_results") == 10
-            assert manager.get("overlay_opacity") == 0.95
-            assert manager.get("theme") == "dark"
-            assert manager.get("fuzzy_threshold") == 60
-            assert manager.get("search_debounce_ms") == 150
-            assert manager.get("auto_reload") is True
-            assert manager.get("run_on_startup") is False
-            assert manager.get("overlay_width") == 600
-            assert manager.get("overlay_height") == 400
-        finally:
-            os.unlink(config_path)
+        # Verify all 11 defaults are present
+        assert manager.get("hotkey") == "ctrl+shift+space"
+        assert "snippets.yaml" in manager.get("snippet_file")
+        assert manager.get("max_results") == 10
+        assert manager.get("overlay_opacity") == 0.95
+        assert manager.get("theme") == "dark"
+        assert manager.get("fuzzy_threshold") == 60
+        assert manager.get("search_debounce_ms") == 150
+        assert manager.get("auto_reload") is True
+        assert manager.get("run_on_startup") is False
+        assert manager.get("overlay_width") == 600
+        assert manager.get("overlay_height") == 400
 
     def test_default_config_path_auto_creation(self):
         """Test ConfigManager with no path argument creates default location"""
-        from src.config_manager import ConfigManager
         from unittest.mock import patch
 
         # Test Windows path (AppData exists)
@@ -515,16 +546,17 @@ class TestConfigEdgeCases:
 
     def test_save_config_error_handling(self):
         """Test save() handles errors gracefully"""
-        from src.config_manager import ConfigManager
         from unittest.mock import patch, MagicMock
 
         with tempfile.TemporaryDirectory() as tmpdir:
             config_path = Path(tmpdir) / "config.yaml"
             manager = ConfigManager(str(config_path))
 
-            # Mock tempfile.NamedTemporaryFile to raise exception
-            with patch("tempfile.NamedTemporaryFile") as mock_temp:
-                mock_temp.side_effect = PermissionError("Cannot write to directory")
+            manager.set("theme", "light")
+
+            # Mock os.replace to fail after the temp file was written
+            with patch("src.config_manager.os.replace") as mock_replace:
+                mock_replace.side_effect = PermissionError("Cannot write to directory")
 
                 # save() should raise the exception
                 try:
@@ -533,34 +565,25 @@ class TestConfigEdgeCases:
                 except PermissionError:
                     pass  # Expected
 
-    def test_validate_type_errors(self):
-        """Test validation catches type errors in numeric fields"""
-        from src.config_manager import ConfigManager
+            # Temp file is cleaned up and the original config is untouched
+            assert list(Path(tmpdir).iterdir()) == [config_path]
+            assert ConfigManager(str(config_path)).get("theme") == "dark"
 
+    def test_validate_type_errors(self, tmp_path):
+        """Test validation catches type errors in numeric fields"""
         # Create config with wrong types
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            config_path = f.name
-            yaml.dump(
-                {
-                    "max_results": "ten",  # Should be int
-                    "overlay_opacity": "high",  # Should be float
-                },
-                f,
-            )
-
-        try:
-            manager = ConfigManager(config_path)
-            is_valid, errors = manager.validate()
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(FIXTURES["wrong_types"])
+
+        manager = ConfigManager(config_path)
+        is_valid, errors = manager.validate()
 
-            # Should detect type errors
-            assert not is_valid
-            assert len(errors) >= 2  # At least 2 type errors
-        finally:
-            os.unlink(config_path)
+        # Should detect type errors
+        assert not is_valid
+        assert len(errors) >= 2  # At least 2 type errors
 
     def test_create_default_config_with_write_error(self):
         """Test that create_default_config handles write errors gracefully"""
-        from src.config_manager import ConfigManager
         from unittest.mock import patch
 
         # Create a non-existent path
@@ -568,7 +591,9 @@ class TestConfigEdgeCases:
             config_path = Path(tmpdir) / "subdir" / "config.yaml"
 
             # Mock open() to raise exception when trying to write default config
-            with patch("builtins.open", side_effect=PermissionError("Cannot write")):
+            with patch(
+                "src.config_manager._open", side_effect=PermissionError("Cannot write")
+            ):
                 # Should still initialize with default values even if write fails
                 manager = ConfigManager(str(config_path))
 
@@ -578,7 +603,6 @@ class TestConfigEdgeCases:
 
     def test_load_config_general_exception(self):
         """Test load_config handles general exceptions during file read"""
-        from src.config_manager import ConfigManager
         from unittest.mock import patch, mock_open
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -586,10 +610,12 @@ class TestConfigEdgeCases:
 
             # Create a valid file first
             with open(config_path, "w") as f:
-                yaml.dump({"hotkey": "ctrl+space"}, f)
+                f.write(_y1("hotkey", "ctrl+space"))
 
             # Mock open() to raise unexpected exception
-            with patch("builtins.open", side_effect=OSError("Unexpected read error")):
+            with patch(
+                "src.config_manager._open", side_effect=OSError("Unexpected read error")
+            ):
                 # Should fall back to defaults
                 manager = ConfigManager(str(config_path))
                 assert (
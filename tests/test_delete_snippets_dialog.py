@@ -3,30 +3,33 @@ Tests for delete_snippets_dialog.py - Snippet deletion with filtering
 """
 
 import pytest
-import sys
-from unittest.mock import Mock, patch, MagicMock
-from PySide6.QtWidgets import QDialog, QMessageBox, QApplication
-from PySide6.QtCore import Qt, QCoreApplication
-from src.delete_snippets_dialog import DeleteSnippetsDialog, SnippetCheckboxItem
+from PySide6.QtWidgets import QDialog, QMessageBox
+from PySide6.QtCore import Qt
+from src.delete_snippets_dialog import (
+    DeleteSnippetsDialog,
+    SnippetCheckboxItem,
+    snippet_matches_filter,
+)
 from src.snippet_manager import Snippet
 from datetime import date
 
 
-@pytest.fixture(scope="module")
-def qt_app():
-    """Create QApplication instance for testing."""
-    # Check if an instance already exists
-    existing_app = QCoreApplication.instance()
-    if existing_app is not None:
-        yield existing_app
-    else:
-        app_instance = QApplication(sys.argv if sys.argv else [])
-        yield app_instance
+class StubManager:
+    """Minimal snippet manager stand-in that records delete_snippets calls."""
 
+    def __init__(self, side_effect=None):
+        self.delete_snippets_calls = []
+        self.side_effect = side_effect
 
-@pytest.fixture
+    def delete_snippets(self, snippet_ids):
+        self.delete_snippets_calls.append(snippet_ids)
+        if self.side_effect is not None:
+            raise self.side_effect
+
+
+@pytest.fixture(scope="session")
 def sample_snippets():
-    """Create sample snippets for testing."""
+    """Create sample snippets for testing (shared, treat as read-only)."""
     return [
         Snippet(
             id="test-1",
@@ -58,6 +61,46 @@ def sample_snippets():
     ]
 
 
+@pytest.fixture(autouse=True)
+def qmessage(monkeypatch):
+    """
+    Replace QMessageBox popups with recorders so no test blocks on a modal.
+
+    Set state["answer"] to choose what question() returns; state["calls"]
+    lists the popups shown, in order.
+    """
+    state = {"answer": QMessageBox.StandardButton.No, "calls": []}
+
+    def _recorder(name):
+        def _show(*args, **kwargs):
+            state["calls"].append(name)
+            if name == "question":
+                return state["answer"]
+            return QMessageBox.StandardButton.Ok
+
+        return staticmethod(_show)
+
+    for name in ("question", "information", "warning", "critical"):
+        monkeypatch.setattr(QMessageBox, name, _recorder(name))
+    return state
+
+
+@pytest.fixture
+def dialog_factory(qt_app):
+    """Build DeleteSnippetsDialogs and close them all on teardown."""
+    created = []
+
+    def _make(snippets, snippet_manager=None):
+        dialog = DeleteSnippetsDialog(snippets, snippet_manager or StubManager())
+        created.append(dialog)
+        return dialog
+
+    yield _make
+
+    for dialog in created:
+        dialog.close()
+
+
 def test_snippet_checkbox_item_creation(sample_snippets, qt_app):
     """Test SnippetCheckboxItem creates correctly."""
     snippet = sample_snippets[0]
@@ -71,28 +114,58 @@ def test_snippet_checkbox_item_creation(sample_snippets, qt_app):
 
 def test_snippet_checkbox_item_matches_filter(sample_snippets):
     """Test filter matching logic."""
-    item = SnippetCheckboxItem(sample_snippets[0])
+    snippet = sample_snippets[0]
 
-    assert item.matches_filter("test")
-    assert item.matches_filter("Test")  # Case insensitive
-    assert item.matches_filter("snippet")
-    assert not item.matches_filter("python")
+    assert snippet_matches_filter(snippet, "test")
+    assert snippet_matches_filter(snippet, "Test")  # Case insensitive
+    assert snippet_matches_filter(snippet, "snippet")
+    assert not snippet_matches_filter(snippet, "python")
 
 
 def test_snippet_checkbox_item_matches_filter_by_tag(sample_snippets):
     """Test filter matching by tags."""
-    item = SnippetCheckboxItem(sample_snippets[1])
+    snippet = sample_snippets[1]
 
-    assert item.matches_filter("python")
-    assert item.matches_filter("debugging")
+    assert snippet_matches_filter(snippet, "python")
+    assert snippet_matches_filter(snippet, "debugging")
 
 
 def test_snippet_checkbox_item_matches_filter_by_content(sample_snippets):
     """Test filter matching by content."""
-    item = SnippetCheckboxItem(sample_snippets[1])
+    snippet = sample_snippets[1]
+
+    assert snippet_matches_filter(snippet, "print")
+    assert snippet_matches_filter(snippet, "debug")
+
+
+def test_snippet_checkbox_item_null_fields(qt_app):
+    """Test filtering tolerates a snippet with null description and tags."""
+    snippet = Snippet(
+        id="bare-1",
+        name="Bare Snippet",
+        description=None,
+        content="echo bare",
+        tags=None,
+        created=date(2025, 11, 4),
+        modified=date(2025, 11, 4),
+    )
+    item = SnippetCheckboxItem(snippet)
+
+    assert snippet_matches_filter(snippet, "bare")
+    assert item.matches_filter("echo")
+    assert not item.matches_filter("python")
+
+    item.close()
+
+
+def test_snippet_checkbox_item_filter_does_not_span_fields(sample_snippets, qt_app):
+    """Test filter text must match within a single field."""
+    item = SnippetCheckboxItem(sample_snippets[2])
 
-    assert item.matches_filter("print")
-    assert item.matches_filter("debug")
+    # Name "Git Clone" followed by description "Git clone command"
+    assert item.matches_filter("clone")
+    assert not item.matches_filter("clone git")
+    assert not item.matches_filter("devops git")
 
 
 def test_snippet_checkbox_item_set_checked(sample_snippets, qt_app):
@@ -108,55 +181,44 @@ def test_snippet_checkbox_item_set_checked(sample_snippets, qt_app):
     item.close()
 
 
-def test_delete_dialog_creation(sample_snippets, qt_app):
+def test_delete_dialog_creation(dialog_factory, sample_snippets):
     """Test dialog initializes correctly."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
+    dialog = dialog_factory(sample_snippets)
 
     assert dialog.windowTitle() == "Delete Snippets"
     assert len(dialog.snippet_items) == 3
     assert dialog.selection_label.text() == "0 snippet(s) selected"
     assert not dialog.delete_button.isEnabled()
 
-    dialog.close()
 
-
-def test_delete_dialog_filter(sample_snippets, qt_app):
-    """Test filtering functionality."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
+@pytest.mark.parametrize(
+    "filter_text, expected_visible",
+    [
+        ("python", 1),
+        ("e", 3),  # Matches "Test", "Python", etc.
+        ("test", 1),
+        ("devops", 1),  # Tag only
+        ("", 3),
+    ],
+)
+def test_delete_dialog_filter(
+    dialog_factory, sample_snippets, filter_text, expected_visible
+):
+    """Test filtering shows only matching snippets."""
+    dialog = dialog_factory(sample_snippets)
 
     # Apply filter
-    dialog.filter_input.setText("python")
-    dialog._apply_filter("python")
+    dialog.filter_input.setText(filter_text)
+    dialog._apply_filter(filter_text)
 
     # Count visible items
     visible_count = sum(1 for item in dialog.snippet_items if item.isVisible())
-    assert visible_count == 1
-
-    dialog.close()
+    assert visible_count == expected_visible
 
 
-def test_delete_dialog_filter_multiple_matches(sample_snippets, qt_app):
-    """Test filtering with multiple matches."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
-
-    # Apply filter that matches multiple snippets
-    dialog.filter_input.setText("e")  # Matches "Test", "Python", etc.
-    dialog._apply_filter("e")
-
-    # Count visible items (should be all 3)
-    visible_count = sum(1 for item in dialog.snippet_items if item.isVisible())
-    assert visible_count == 3
-
-    dialog.close()
-
-
-def test_delete_dialog_clear_filter(sample_snippets, qt_app):
+def test_delete_dialog_clear_filter(dialog_factory, sample_snippets):
     """Test clearing filter."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
+    dialog = dialog_factory(sample_snippets)
 
     # Apply filter
     dialog.filter_input.setText("python")
@@ -170,13 +232,10 @@ def test_delete_dialog_clear_filter(sample_snippets, qt_app):
     assert visible_count == 3
     assert dialog.filter_input.text() == ""
 
-    dialog.close()
-
 
-def test_select_all_checkbox(sample_snippets, qt_app):
+def test_select_all_checkbox(dialog_factory, sample_snippets):
     """Test select all functionality."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
+    dialog = dialog_factory(sample_snippets)
 
     # Check select all
     dialog.select_all_checkbox.setChecked(True)
@@ -185,13 +244,10 @@ def test_select_all_checkbox(sample_snippets, qt_app):
     # Verify all checked
     assert all(item.is_checked() for item in dialog.snippet_items)
 
-    dialog.close()
-
 
-def test_deselect_all_checkbox(sample_snippets, qt_app):
+def test_deselect_all_checkbox(dialog_factory, sample_snippets):
     """Test deselect all functionality."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
+    dialog = dialog_factory(sample_snippets)
 
     # Check all items first
     for item in dialog.snippet_items:
@@ -204,13 +260,10 @@ def test_deselect_all_checkbox(sample_snippets, qt_app):
     # Verify all unchecked
     assert not any(item.is_checked() for item in dialog.snippet_items)
 
-    dialog.close()
 
-
-def test_select_all_with_filter(sample_snippets, qt_app):
+def test_select_all_with_filter(dialog_factory, sample_snippets):
     """Test select all with filter active."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
+    dialog = dialog_factory(sample_snippets)
 
     # Apply filter
     dialog.filter_input.setText("test")
@@ -226,13 +279,10 @@ def test_select_all_with_filter(sample_snippets, qt_app):
     )
     assert visible_checked == 1  # Only "Test Snippet 1" matches
 
-    dialog.close()
-
 
-def test_delete_button_state(sample_snippets, qt_app):
+def test_delete_button_state(dialog_factory, sample_snippets):
     """Test delete button enabled/disabled based on selection."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
+    dialog = dialog_factory(sample_snippets)
 
     # Initially disabled
     assert not dialog.delete_button.isEnabled()
@@ -245,13 +295,10 @@ def test_delete_button_state(sample_snippets, qt_app):
     assert dialog.delete_button.isEnabled()
     assert "Delete Selected (1)" in dialog.delete_button.text()
 
-    dialog.close()
-
 
-def test_delete_button_text_updates(sample_snippets, qt_app):
+def test_delete_button_text_updates(dialog_factory, sample_snippets):
     """Test delete button text updates with selection count."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
+    dialog = dialog_factory(sample_snippets)
 
     # Check multiple items
     dialog.snippet_items[0].set_checked(True)
@@ -261,114 +308,85 @@ def test_delete_button_text_updates(sample_snippets, qt_app):
     assert "Delete Selected (2)" in dialog.delete_button.text()
     assert dialog.selection_label.text() == "2 snippet(s) selected"
 
-    dialog.close()
 
-
-def test_delete_confirmation_shown(sample_snippets, qt_app):
+def test_delete_confirmation_shown(dialog_factory, sample_snippets, qmessage):
     """Test confirmation dialog appears."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
+    dialog = dialog_factory(sample_snippets)
 
     # Check one item
     dialog.snippet_items[0].set_checked(True)
 
-    with patch.object(
-        QMessageBox, "question", return_value=QMessageBox.StandardButton.No
-    ) as mock_msg:
-        dialog._on_delete_clicked()
-
-        # Verify confirmation shown
-        mock_msg.assert_called_once()
+    dialog._on_delete_clicked()
 
-    dialog.close()
+    # Verify confirmation shown
+    assert qmessage["calls"] == ["question"]
 
 
-def test_delete_confirmation_cancelled(sample_snippets, qt_app):
+def test_delete_confirmation_cancelled(dialog_factory, sample_snippets, qmessage):
     """Test cancelling deletion confirmation."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
+    stub_manager = StubManager()
+    dialog = dialog_factory(sample_snippets, stub_manager)
 
     # Check one item
     dialog.snippet_items[0].set_checked(True)
 
-    with patch.object(
-        QMessageBox, "question", return_value=QMessageBox.StandardButton.No
-    ):
-        dialog._on_delete_clicked()
-
-        # Verify delete_snippets not called
-        mock_manager.delete_snippets.assert_not_called()
+    qmessage["answer"] = QMessageBox.StandardButton.No
+    dialog._on_delete_clicked()
 
-    dialog.close()
+    # Verify delete_snippets not called
+    assert stub_manager.delete_snippets_calls == []
 
 
-def test_delete_snippets_called(sample_snippets, qt_app):
+def test_delete_snippets_called(dialog_factory, sample_snippets, qmessage):
     """Test snippet_manager.delete_snippets is called."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
+    stub_manager = StubManager()
+    dialog = dialog_factory(sample_snippets, stub_manager)
 
     # Check one item
     dialog.snippet_items[0].set_checked(True)
 
-    with patch.object(
-        QMessageBox, "question", return_value=QMessageBox.StandardButton.Yes
-    ):
-        with patch.object(QMessageBox, "information"):
-            dialog._on_delete_clicked()
+    qmessage["answer"] = QMessageBox.StandardButton.Yes
+    dialog._on_delete_clicked()
 
     # Verify delete_snippets called with correct ID
-    mock_manager.delete_snippets.assert_called_once_with(["test-1"])
+    assert stub_manager.delete_snippets_calls == [["test-1"]]
 
-    dialog.close()
 
-
-def test_delete_multiple_snippets(sample_snippets, qt_app):
+def test_delete_multiple_snippets(dialog_factory, sample_snippets, qmessage):
     """Test deleting multiple snippets at once."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
+    stub_manager = StubManager()
+    dialog = dialog_factory(sample_snippets, stub_manager)
 
     # Check multiple items
     dialog.snippet_items[0].set_checked(True)
     dialog.snippet_items[1].set_checked(True)
 
-    with patch.object(
-        QMessageBox, "question", return_value=QMessageBox.StandardButton.Yes
-    ):
-        with patch.object(QMessageBox, "information"):
-            dialog._on_delete_clicked()
+    qmessage["answer"] = QMessageBox.StandardButton.Yes
+    dialog._on_delete_clicked()
 
     # Verify delete_snippets called with correct IDs
-    mock_manager.delete_snippets.assert_called_once_with(["test-1", "python-1"])
-
-    dialog.close()
+    assert stub_manager.delete_snippets_calls == [["test-1", "python-1"]]
 
 
-def test_delete_error_handling(sample_snippets, qt_app):
+def test_delete_error_handling(dialog_factory, sample_snippets, qmessage):
     """Test error handling when deletion fails."""
-    mock_manager = Mock()
-    mock_manager.delete_snippets.side_effect = Exception("Delete failed")
+    stub_manager = StubManager(side_effect=Exception("Delete failed"))
 
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
+    dialog = dialog_factory(sample_snippets, stub_manager)
 
     # Check one item
     dialog.snippet_items[0].set_checked(True)
 
-    with patch.object(
-        QMessageBox, "question", return_value=QMessageBox.StandardButton.Yes
-    ):
-        with patch.object(QMessageBox, "critical") as mock_critical:
-            dialog._on_delete_clicked()
-
-            # Verify error dialog shown
-            mock_critical.assert_called_once()
+    qmessage["answer"] = QMessageBox.StandardButton.Yes
+    dialog._on_delete_clicked()
 
-    dialog.close()
+    # Verify error dialog shown
+    assert qmessage["calls"].count("critical") == 1
 
 
-def test_confirmation_lists_snippet_names(sample_snippets, qt_app):
+def test_confirmation_lists_snippet_names(dialog_factory, sample_snippets):
     """Test confirmation dialog lists snippet names."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
+    dialog = dialog_factory(sample_snippets)
 
     # Check items
     dialog.snippet_items[0].set_checked(True)
@@ -381,13 +399,10 @@ def test_confirmation_lists_snippet_names(sample_snippets, qt_app):
     # Can't easily verify message box content without mocking, but we can verify it returns bool
     assert isinstance(result, bool)
 
-    dialog.close()
 
-
-def test_filter_preserves_checkbox_state(sample_snippets, qt_app):
+def test_filter_preserves_checkbox_state(dialog_factory, sample_snippets):
     """Test that filtering preserves checkbox states."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog(sample_snippets, mock_manager)
+    dialog = dialog_factory(sample_snippets)
 
     # Check first item
     dialog.snippet_items[0].set_checked(True)
@@ -402,16 +417,11 @@ def test_filter_preserves_checkbox_state(sample_snippets, qt_app):
     # First item should still be checked
     assert dialog.snippet_items[0].is_checked()
 
-    dialog.close()
-
 
-def test_empty_snippets_list(qt_app):
+def test_empty_snippets_list(dialog_factory):
     """Test dialog with empty snippets list."""
-    mock_manager = Mock()
-    dialog = DeleteSnippetsDialog([], mock_manager)
+    dialog = dialog_factory([])
 
     assert len(dialog.snippet_items) == 0
     assert dialog.selection_label.text() == "0 snippet(s) selected"
     assert not dialog.delete_button.isEnabled()
-
-    dialog.close()
@@ -115,6 +115,18 @@ def test_limit_suggestions():
     assert len(result) <= 10
 
 
+def test_prefix_matches_stop_at_first_ten_alphabetically():
+    """Test that 10+ prefix hits return the first 10 in alphabetical order."""
+    # Setup: 20 prefix tags in reverse order plus a substring-only match
+    tags = [f"test-{i:02d}" for i in reversed(range(20))] + ["unittest"]
+    completer = FuzzyTagCompleter(tags)
+
+    # Action: splitPath("test")
+    # Expected: test-00 .. test-09, substring match excluded
+    result = completer.splitPath("test")
+    assert result == [f"test-{i:02d}" for i in range(10)]
+
+
 def test_update_tags_method(basic_tags):
     """Test that update_tags() method updates the tag list."""
     # Setup: FuzzyTagCompleter with ["old-tag"]
@@ -8,24 +8,12 @@ This module tests:
 - Hotkey unregistration and cleanup
 """
 
-import pytest
-import sys
 from unittest.mock import Mock, patch, MagicMock
-from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QObject, Signal
 from pynput import keyboard
 
 
-@pytest.fixture
-def qapp():
-    """Create Qt application for testing."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
-    yield app
-
-
-def test_hotkey_registration(qapp):
+def test_hotkey_registration(qt_app):
     """Test that global hotkey is registered correctly."""
     from src.hotkey_manager import HotkeyManager
 
@@ -42,7 +30,7 @@ def test_hotkey_registration(qapp):
     assert isinstance(manager, QObject)
 
 
-def test_hotkey_parsing(qapp):
+def test_hotkey_parsing(qt_app):
     """Test that hotkey strings are parsed correctly."""
     from src.hotkey_manager import HotkeyManager
 
@@ -57,7 +45,7 @@ def test_hotkey_parsing(qapp):
     assert keyboard.Key.space in combination
 
 
-def test_hotkey_listener_start(qapp):
+def test_hotkey_listener_start(qt_app):
     """Test that hotkey listener starts correctly."""
     from src.hotkey_manager import HotkeyManager
 
@@ -75,7 +63,7 @@ def test_hotkey_listener_start(qapp):
         mock_listener_instance.start.assert_called_once()
 
 
-def test_hotkey_callback_triggered(qapp):
+def test_hotkey_callback_triggered(qt_app):
     """Test that hotkey press triggers Qt signal emission."""
     from src.hotkey_manager import HotkeyManager
 
@@ -95,13 +83,13 @@ def test_hotkey_callback_triggered(qapp):
     manager._on_press(keyboard.Key.space)
 
     # Process Qt events to handle signal
-    qapp.processEvents()
+    qt_app.processEvents()
 
     # Verify signal was emitted
     assert len(signal_emitted) > 0
 
 
-def test_hotkey_release_tracking(qapp):
+def test_hotkey_release_tracking(qt_app):
     """Test that key releases are tracked correctly."""
     from src.hotkey_manager import HotkeyManager
 
@@ -123,7 +111,7 @@ def test_hotkey_release_tracking(qapp):
     assert keyboard.Key.shift not in manager.current_keys
 
 
-def test_hotkey_unregistration(qapp):
+def test_hotkey_unregistration(qt_app):
     """Test that hotkey listener is stopped and cleaned up."""
     from src.hotkey_manager import HotkeyManager
 
@@ -144,7 +132,7 @@ def test_hotkey_unregistration(qapp):
         assert manager.listener is None
 
 
-def test_multiple_start_calls_ignored(qapp):
+def test_multiple_start_calls_ignored(qt_app):
     """Test that calling start() multiple times doesn't create multiple listeners."""
     from src.hotkey_manager import HotkeyManager
 
@@ -162,7 +150,7 @@ def test_multiple_start_calls_ignored(qapp):
         assert mock_listener_class.call_count == 1
 
 
-def test_hotkey_detection_with_both_ctrl_keys(qapp):
+def test_hotkey_detection_with_both_ctrl_keys(qt_app):
     """Test that hotkey works with either left or right Ctrl."""
     from src.hotkey_manager import HotkeyManager
 
@@ -182,7 +170,7 @@ def test_hotkey_detection_with_both_ctrl_keys(qapp):
     manager._on_press(keyboard.Key.space)
 
     # Process Qt events
-    qapp.processEvents()
+    qt_app.processEvents()
 
     # Verify signal was emitted (works with right Ctrl too)
     assert len(signal_emitted) > 0
@@ -14,29 +14,14 @@ Test Coverage:
 """
 
 import pytest
-import sys
 from unittest.mock import Mock, patch, MagicMock
-from PySide6.QtCore import Qt, QCoreApplication
+from PySide6.QtCore import Qt
 from src.config_manager import ConfigManager
 from src.snippet_manager import SnippetManager
 from src.search_engine import SearchEngine
 import src.variable_handler as variable_handler
 
 
-@pytest.fixture(scope="module")
-def qt_app():
-    """Create QApplication instance for testing."""
-    from PySide6.QtWidgets import QApplication
-
-    # Check if an instance already exists
-    existing_app = QCoreApplication.instance()
-    if existing_app is not None:
-        yield existing_app
-    else:
-        app_instance = QApplication(sys.argv if sys.argv else [])
-        yield app_instance
-
-
 @pytest.fixture
 def overlay_window(qt_app, tmp_path):
     """Create OverlayWindow instance for testing."""
@@ -334,7 +319,7 @@ def test_delete_button_exists(overlay_window):
 
 def test_delete_button_click_opens_dialog(overlay_window):
     """Test clicking delete button opens DeleteSnippetsDialog."""
-    with patch("src.overlay_window.DeleteSnippetsDialog") as mock_dialog_class:
+    with patch("src.delete_snippets_dialog.DeleteSnippetsDialog") as mock_dialog_class:
         # Setup mock dialog
         mock_dialog = Mock()
         mock_dialog.exec.return_value = 0  # QDialog.DialogCode.Rejected
@@ -352,7 +337,7 @@ def test_delete_button_click_opens_dialog(overlay_window):
 
 def test_delete_button_click_updates_results_on_delete(overlay_window):
     """Test that clicking delete button and accepting updates results."""
-    with patch("src.overlay_window.DeleteSnippetsDialog") as mock_dialog_class:
+    with patch("src.delete_snippets_dialog.DeleteSnippetsDialog") as mock_dialog_class:
         # Setup mock dialog to return Accepted
         mock_dialog = Mock()
         mock_dialog.exec.return_value = 1  # QDialog.DialogCode.Accepted
@@ -374,7 +359,7 @@ def test_delete_button_click_updates_results_on_delete(overlay_window):
 
 def test_ctrl_d_shortcut_opens_delete_dialog(overlay_window):
     """Test Ctrl+D keyboard shortcut opens delete dialog."""
-    with patch("src.overlay_window.DeleteSnippetsDialog") as mock_dialog_class:
+    with patch("src.delete_snippets_dialog.DeleteSnippetsDialog") as mock_dialog_class:
         # Setup mock dialog
         mock_dialog = Mock()
         mock_dialog.exec.return_value = 0  # QDialog.DialogCode.Rejected
@@ -402,7 +387,7 @@ def test_delete_snippet_handler_method_exists(overlay_window):
 
 def test_delete_button_passes_snippets_to_dialog(overlay_window):
     """Test that delete button passes all snippets to dialog."""
-    with patch("src.overlay_window.DeleteSnippetsDialog") as mock_dialog_class:
+    with patch("src.delete_snippets_dialog.DeleteSnippetsDialog") as mock_dialog_class:
         # Setup mock dialog
         mock_dialog = Mock()
         mock_dialog.exec.return_value = 0
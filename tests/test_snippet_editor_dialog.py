@@ -10,7 +10,6 @@ Test Coverage:
 """
 
 import pytest
-import sys
 from unittest.mock import Mock, MagicMock, patch
 from PySide6.QtCore import Qt, QCoreApplication
 from PySide6.QtWidgets import QCompleter
@@ -19,20 +18,6 @@ from src.snippet_manager import SnippetManager
 from src.fuzzy_tag_completer import FuzzyTagCompleter
 
 
-@pytest.fixture(scope="module")
-def qt_app():
-    """Create QApplication instance for testing."""
-    from PySide6.QtWidgets import QApplication
-
-    # Check if an instance already exists
-    existing_app = QCoreApplication.instance()
-    if existing_app is not None:
-        yield existing_app
-    else:
-        app_instance = QApplication(sys.argv if sys.argv else [])
-        yield app_instance
-
-
 @pytest.fixture
 def mock_snippet_manager():
     """Create a mock SnippetManager with predefined tags."""
@@ -451,3 +436,83 @@ def test_trailing_comma_ready_for_next_tag(qt_app):
     assert model.rowCount() > 0
 
     dialog.close()
+
+
+def test_popup_geometry_recomputed_only_after_move(qt_app):
+    """
+    Popup position is cached between shows and refreshed after a dialog move.
+
+    Verifies:
+    - First show computes geometry and clears the dirty flag
+    - Moving the dialog marks the cached geometry dirty again
+    """
+    manager = Mock(spec=SnippetManager)
+    manager.get_all_tags.return_value = ["python", "pyside", "pytest"]
+
+    dialog = SnippetEditorDialog(snippet_manager=manager, parent=None)
+    dialog.show()
+    popup = dialog.fuzzy_completer.popup()
+
+    dialog.tags_input.setText("py")
+    dialog._run_tag_search()
+    assert popup.isVisible()
+    assert dialog._popup_geom_dirty is False
+
+    popup.hide()
+    dialog.move(dialog.pos().x() + 40, dialog.pos().y() + 40)
+    QCoreApplication.processEvents()
+    assert dialog._popup_geom_dirty is True
+
+    dialog.close()
+
+
+def test_tag_search_does_not_pump_event_loop(qt_app):
+    """
+    Showing the suggestions popup must not re-enter the Qt event loop.
+
+    Verifies:
+    - _run_tag_search fills the popup model and shows the popup
+    - QApplication.processEvents is never called on the keystroke path
+    """
+    from PySide6.QtWidgets import QApplication
+
+    manager = Mock(spec=SnippetManager)
+    manager.get_all_tags.return_value = ["python", "pyside", "testing"]
+
+    dialog = SnippetEditorDialog(snippet_manager=manager, parent=None)
+    dialog.show()
+
+    dialog.tags_input.setText("py")
+    with patch.object(QApplication, "processEvents") as mock_process_events:
+        dialog._run_tag_search()
+
+    mock_process_events.assert_not_called()
+    assert dialog._popup_model.stringList() == ["pyside", "python"]
+    assert dialog.fuzzy_completer.popup().isVisible()
+
+    dialog.close()
+
+
+def test_tag_search_tolerates_typo_in_first_character(qt_app):
+    """
+    Fuzzy suggestions fall back to all tags when the first character is wrong.
+
+    Verifies:
+    - "oython" still suggests "python"
+    - "cta" still suggests "ta"
+    """
+    manager = Mock(spec=SnippetManager)
+    manager.get_all_tags.return_value = ["cat", "python", "ta", "testing"]
+
+    dialog = SnippetEditorDialog(snippet_manager=manager, parent=None)
+    dialog.show()
+
+    dialog.tags_input.setText("oython")
+    dialog._run_tag_search()
+    assert dialog._popup_model.stringList() == ["python"]
+
+    dialog.tags_input.setText("cta")
+    dialog._run_tag_search()
+    assert "ta" in dialog._popup_model.stringList()
+
+    dialog.close()
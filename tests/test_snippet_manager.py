@@ -18,6 +18,7 @@ Test Coverage:
 11. Validate ID uniqueness
 """
 
+import os
 import pytest
 import time
 import yaml
@@ -168,6 +169,40 @@ def test_validate_snippet_schema():
     assert invalid_snippet_no_content.validate() is False
 
 
+def test_load_skips_entries_with_bad_dates_or_ids(temp_snippets_file):
+    """
+    Test malformed entries are skipped without affecting valid ones.
+
+    Verifies:
+    - Unparseable date strings, non-string IDs and non-dict entries are skipped
+    - Valid snippets in the same file still load
+    """
+    temp_snippets_file.write_text(
+        """
+version: 1
+snippets:
+  - id: good
+    name: Good
+    content: echo good
+    created: "2025-11-04"
+  - id: bad-date
+    name: Bad date
+    content: echo bad
+    created: "not-a-date"
+  - id: 123
+    name: Numeric ID
+    content: echo numeric
+  - just a string
+"""
+    )
+    manager = SnippetManager(str(temp_snippets_file))
+
+    snippets = manager.load()
+
+    assert [s.id for s in snippets] == ["good"]
+    assert snippets[0].created == date(2025, 11, 4)
+
+
 # ============================================================================
 # Test Case 3: Load Malformed YAML
 # ============================================================================
@@ -348,6 +383,41 @@ snippets:
         observer.join()
 
 
+def test_file_watcher_detects_rename_onto_custom_file(tmp_path):
+    """
+    Test file watcher handles atomic saves to a non-default filename.
+
+    Verifies:
+    - Replacing the file via rename triggers the callback
+    - Changes to sibling files are ignored
+    """
+    snippets_file = tmp_path / "my-snippets.yaml"
+    manager = SnippetManager(str(snippets_file))
+    manager.load()
+
+    reload_count = [0]
+
+    def on_reload():
+        reload_count[0] += 1
+
+    observer = manager.watch_file(on_reload)
+
+    try:
+        (tmp_path / "other.yaml").write_text("unrelated: true\n")
+
+        temp_file = tmp_path / "my-snippets.yaml.tmp"
+        temp_file.write_text(snippets_file.read_text())
+        temp_file.replace(snippets_file)
+
+        # Wait for debounce period (500ms) + buffer
+        time.sleep(0.8)
+
+        assert reload_count[0] == 1
+    finally:
+        observer.stop()
+        observer.join()
+
+
 # ============================================================================
 # Test Case 6: Backup Creation
 # ============================================================================
@@ -509,6 +579,34 @@ snippets:
     assert "Duplicate ID" in caplog.text or "duplicate" in caplog.text.lower()
 
 
+def test_duplicate_ids_skip_taken_suffixes(temp_snippets_file):
+    """
+    Test many duplicates of one ID get consecutive free suffixes.
+
+    Verifies:
+    - Suffixes already present in the file are skipped
+    - Each further duplicate gets the next free suffix
+    """
+    manager = SnippetManager(str(temp_snippets_file))
+    ids = ["dup", "dup-2", "dup", "dup", "dup"]
+    snippets = [
+        Snippet(
+            id=snippet_id,
+            name=f"Snippet {i}",
+            description="",
+            content="echo test",
+            tags=[],
+            created=date.today(),
+            modified=date.today(),
+        )
+        for i, snippet_id in enumerate(ids)
+    ]
+
+    fixed = manager._fix_duplicate_ids(snippets)
+
+    assert [s.id for s in fixed] == ["dup", "dup-2", "dup-1", "dup-3", "dup-4"]
+
+
 # ============================================================================
 # Test Case 9: Large Snippet Library Performance
 # ============================================================================
@@ -862,6 +960,75 @@ snippets:
     assert len(tags) == 7
 
 
+def test_get_all_tags_cache_invalidated_on_add(temp_snippets_file):
+    """
+    Test get_all_tags() caches its result until snippets change.
+
+    Verifies:
+    - Repeated calls return the cached list
+    - add_snippet() + reload picks up the new tag
+    """
+    manager = SnippetManager(str(temp_snippets_file))
+    manager.load()
+
+    tags = manager.get_all_tags()
+    assert manager.get_all_tags() is tags
+    assert "brand-new-tag" not in tags
+
+    manager.add_snippet(
+        {
+            "id": "cache-test",
+            "name": "Cache test",
+            "description": "",
+            "content": "echo cache",
+            "tags": ["brand-new-tag"],
+            "created": "2025-11-04",
+            "modified": "2025-11-04",
+        }
+    )
+    manager.load()
+
+    assert "brand-new-tag" in manager.get_all_tags()
+
+
+def test_get_all_tags_follows_snippet_list_identity(temp_snippets_file):
+    """
+    Test get_all_tags() recomputes when the snippet list is replaced.
+
+    Verifies:
+    - Assigning a new list to manager.snippets invalidates the cached tags
+    - A new list is not mistaken for a freed one that had the same address
+    """
+
+    def make_snippet(tag):
+        return Snippet(
+            id=tag,
+            name=tag.title(),
+            description="",
+            content=f"echo {tag}",
+            tags=[tag],
+            created=date.today(),
+            modified=date.today(),
+        )
+
+    manager = SnippetManager(str(temp_snippets_file))
+    manager.load()
+    assert "replaced" not in manager.get_all_tags()
+
+    manager.snippets = [make_snippet("replaced")]
+
+    assert manager.get_all_tags() == ["replaced"]
+
+    # Free the old list before assigning the new one, so it may reuse its id()
+    old_snippet, new_snippet = make_snippet("old"), make_snippet("new")
+    for _ in range(50):
+        manager.snippets = [old_snippet]
+        assert manager.get_all_tags() == ["old"]
+        manager.snippets = None
+        manager.snippets = [new_snippet]
+        assert manager.get_all_tags() == ["new"]
+
+
 # ============================================================================
 # Test Case 16: Delete Snippets
 # ============================================================================
@@ -1002,6 +1169,27 @@ snippets:
     assert len(remaining) == 0
 
 
+def test_delete_snippets_reuses_parsed_snippets(temp_snippets_file):
+    """
+    Test delete_snippets() does not re-parse an unchanged file.
+
+    Verifies:
+    - No YAML parse happens during delete after a load()
+    - The requested snippets are removed
+    """
+    manager = SnippetManager(str(temp_snippets_file))
+    snippets = manager.load()
+    to_delete = [snippets[0].id, snippets[1].id]
+
+    with patch("src.snippet_manager.yaml_load") as mock_load:
+        manager.delete_snippets(to_delete)
+    mock_load.assert_not_called()
+
+    remaining_ids = {s.id for s in manager.load()}
+    assert remaining_ids.isdisjoint(to_delete)
+    assert len(remaining_ids) == len(snippets) - 2
+
+
 def test_get_all_snippets(temp_snippets_file):
     """
     Test get_all_snippets convenience method.
@@ -1044,6 +1232,69 @@ snippets:
     assert snippets[1].id == "snippet-2"
 
 
+def test_load_skips_parse_when_file_unchanged(temp_snippets_file):
+    """
+    Test load() reuses parsed snippets while mtime and size are unchanged.
+
+    Verifies:
+    - Second load() of an untouched file does not re-parse it
+    - Editing the file triggers a fresh parse
+    """
+    manager = SnippetManager(str(temp_snippets_file))
+    manager.load()
+
+    with patch("src.snippet_manager.yaml_load") as mock_load:
+        cached = manager.load()
+    mock_load.assert_not_called()
+    assert cached is manager.snippets
+
+    yaml_content = """
+version: 1
+snippets:
+  - id: edited
+    name: Edited externally
+    description: Replaces the sample file
+    content: echo "edited"
+    tags: [test]
+"""
+    temp_snippets_file.write_text(yaml_content)
+
+    snippets = manager.load()
+    assert [s.id for s in snippets] == ["edited"]
+
+
+def test_add_snippet_appends_without_reparsing(temp_snippets_file):
+    """
+    Test add_snippet() appends to an unchanged file without re-parsing it.
+
+    Verifies:
+    - The file is not parsed during add_snippet() after a load()
+    - Duplicate IDs are still resolved against IDs already in the file
+    - The appended file loads with all snippets intact
+    """
+    manager = SnippetManager(str(temp_snippets_file))
+    original_count = len(manager.load())
+
+    new_snippet = {
+        "id": "git-uncommit",
+        "name": "Appended",
+        "description": "",
+        "content": "line 1\n\n  indented line\n",
+        "tags": ["append"],
+        "created": "2025-11-04",
+        "modified": "2025-11-04",
+    }
+    with patch("src.snippet_manager.yaml_load") as mock_load:
+        assert manager.add_snippet(dict(new_snippet)) is True
+        assert manager.add_snippet(dict(new_snippet)) is True
+    mock_load.assert_not_called()
+
+    snippets = manager.load()
+    assert len(snippets) == original_count + 2
+    assert [s.id for s in snippets[-2:]] == ["git-uncommit-1", "git-uncommit-2"]
+    assert snippets[-1].content == "line 1\n\n  indented line\n"
+
+
 def test_save_snippets_preserves_data(temp_snippets_file):
     """
     Test that _save_snippets preserves all snippet data.
@@ -1258,6 +1509,105 @@ snippets:
     assert current_snippets[0].id == "snippet-3"
 
 
+def test_update_missing_snippet_does_not_link_backup(temp_snippets_file):
+    """
+    Test that updating an unknown ID leaves no backup tied to the live file.
+
+    Verifies:
+    - update_snippet returns False for a missing ID
+    - No backup shares storage with the snippets file
+    - A later append does not leak into any backup
+    """
+    manager = SnippetManager(str(temp_snippets_file))
+
+    yaml_content = """
+version: 1
+snippets:
+  - id: original-snippet
+    name: Original Snippet
+    description: Original content
+    content: echo "original"
+    tags: [test]
+    created: 2025-11-04
+    modified: 2025-11-04
+"""
+    temp_snippets_file.write_text(yaml_content)
+    manager.load()
+
+    assert not manager.update_snippet("missing-id", {"name": "Missing"})
+
+    new_snippet = {
+        "id": "new-snippet",
+        "name": "New Snippet",
+        "description": "New content",
+        "content": 'echo "new"',
+        "tags": ["test"],
+        "created": "2025-11-04",
+        "modified": "2025-11-04",
+    }
+    assert manager.add_snippet(new_snippet)
+
+    for backup_file in temp_snippets_file.parent.glob("snippets.yaml.backup.*"):
+        assert not os.path.samefile(temp_snippets_file, backup_file)
+        assert "new-snippet" not in backup_file.read_text()
+
+
+def test_failed_save_does_not_link_backup(temp_snippets_file):
+    """
+    Test that a save failing at the final rename leaves an independent backup.
+
+    Verifies:
+    - delete_snippets raises and the snippets file is unchanged
+    - The rotated backup is not a hardlink to the snippets file
+    - A following append leaves the backup untouched
+    """
+    manager = SnippetManager(str(temp_snippets_file))
+
+    yaml_content = """
+version: 1
+snippets:
+  - id: snippet-1
+    name: Snippet 1
+    description: First snippet
+    content: echo "test 1"
+    tags: [test]
+    created: 2025-11-04
+    modified: 2025-11-04
+"""
+    temp_snippets_file.write_text(yaml_content)
+    manager.load()
+
+    real_replace = os.replace
+
+    def failing_replace(src, dst):
+        if str(src).endswith("snippets.yaml.tmp"):
+            raise OSError("disk full")
+        return real_replace(src, dst)
+
+    with patch("src.snippet_manager.os.replace", side_effect=failing_replace):
+        with pytest.raises(IOError):
+            manager.delete_snippets(["snippet-1"])
+
+    assert temp_snippets_file.read_text() == yaml_content
+    backup_file = Path(f"{temp_snippets_file}.backup.001")
+    assert not os.path.samefile(temp_snippets_file, backup_file)
+
+    new_snippet = {
+        "id": "new-snippet",
+        "name": "New Snippet",
+        "description": "New content",
+        "content": 'echo "new"',
+        "tags": ["test"],
+        "created": "2025-11-04",
+        "modified": "2025-11-04",
+    }
+    assert manager.add_snippet(new_snippet)
+
+    assert len(manager.load()) == 2
+    assert not os.path.samefile(temp_snippets_file, backup_file)
+    assert "new-snippet" not in backup_file.read_text()
+
+
 # ============================================================================
 # Test Case 20: Manual Backup with Timestamp
 # ============================================================================
@@ -9,21 +9,11 @@ This module tests:
 """
 
 import pytest
-import sys
 from unittest.mock import Mock, patch, MagicMock, call
-from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
+from PySide6.QtWidgets import QSystemTrayIcon, QMenu
 from PySide6.QtGui import QAction
 
 
-@pytest.fixture
-def qapp():
-    """Create Qt application for testing."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
-    yield app
-
-
 @pytest.fixture
 def mock_overlay_window():
     """Mock overlay window."""
@@ -51,7 +41,7 @@ def mock_config_manager():
 
 
 def test_tray_icon_creation(
-    qapp, mock_overlay_window, mock_snippet_manager, mock_config_manager
+    qt_app, mock_overlay_window, mock_snippet_manager, mock_config_manager
 ):
     """Test that system tray icon is created and displayed."""
     from src.system_tray import SystemTray
@@ -70,7 +60,7 @@ def test_tray_icon_creation(
 
 
 def test_tray_menu_creation(
-    qapp, mock_overlay_window, mock_snippet_manager, mock_config_manager
+    qt_app, mock_overlay_window, mock_snippet_manager, mock_config_manager
 ):
     """Test that context menu is created with all actions."""
     from src.system_tray import SystemTray
@@ -105,7 +95,7 @@ def test_tray_menu_creation(
 
 
 def test_menu_action_open_overlay(
-    qapp, mock_overlay_window, mock_snippet_manager, mock_config_manager
+    qt_app, mock_overlay_window, mock_snippet_manager, mock_config_manager
 ):
     """Test that 'Open Overlay' action shows the overlay window."""
     from src.system_tray import SystemTray
@@ -121,7 +111,7 @@ def test_menu_action_open_overlay(
 
 
 def test_menu_action_edit_snippets(
-    qapp, mock_overlay_window, mock_snippet_manager, mock_config_manager
+    qt_app, mock_overlay_window, mock_snippet_manager, mock_config_manager
 ):
     """Test that 'Edit Snippets' action opens YAML file in default editor."""
     from src.system_tray import SystemTray
@@ -139,7 +129,7 @@ def test_menu_action_edit_snippets(
 
 
 def test_menu_action_reload_snippets_success(
-    qapp, mock_overlay_window, mock_snippet_manager, mock_config_manager
+    qt_app, mock_overlay_window, mock_snippet_manager, mock_config_manager
 ):
     """Test that 'Reload Snippets' action hot-reloads from file successfully."""
     from src.system_tray import SystemTray
@@ -166,7 +156,7 @@ def test_menu_action_reload_snippets_success(
 
 
 def test_menu_action_reload_snippets_failure(
-    qapp, mock_overlay_window, mock_snippet_manager, mock_config_manager
+    qt_app, mock_overlay_window, mock_snippet_manager, mock_config_manager
 ):
     """Test that 'Reload Snippets' action handles errors gracefully."""
     from src.system_tray import SystemTray
@@ -190,7 +180,7 @@ def test_menu_action_reload_snippets_failure(
 
 
 def test_menu_action_about(
-    qapp, mock_overlay_window, mock_snippet_manager, mock_config_manager
+    qt_app, mock_overlay_window, mock_snippet_manager, mock_config_manager
 ):
     """Test that 'About' action shows version information."""
     from src.system_tray import SystemTray
@@ -211,7 +201,7 @@ def test_menu_action_about(
 
 
 def test_menu_action_exit(
-    qapp, mock_overlay_window, mock_snippet_manager, mock_config_manager
+    qt_app, mock_overlay_window, mock_snippet_manager, mock_config_manager
 ):
     """Test that 'Exit' action triggers graceful shutdown."""
     from src.system_tray import SystemTray
@@ -226,7 +216,7 @@ def test_menu_action_exit(
 
 
 def test_menu_has_backup_actions(
-    qapp, mock_overlay_window, mock_snippet_manager, mock_config_manager
+    qt_app, mock_overlay_window, mock_snippet_manager, mock_config_manager
 ):
     """Test that context menu includes backup-related actions."""
     from src.system_tray import SystemTray
@@ -245,7 +235,7 @@ def test_menu_has_backup_actions(
 
 
 def test_menu_action_backup_now(
-    qapp, mock_overlay_window, mock_snippet_manager, mock_config_manager
+    qt_app, mock_overlay_window, mock_snippet_manager, mock_config_manager
 ):
     """Test that 'Backup Now' action creates manual backup."""
     from src.system_tray import SystemTray
@@ -268,7 +258,7 @@ def test_menu_action_backup_now(
 
 
 def test_menu_action_backup_now_failure(
-    qapp, mock_overlay_window, mock_snippet_manager, mock_config_manager
+    qt_app, mock_overlay_window, mock_snippet_manager, mock_config_manager
 ):
     """Test that 'Backup Now' action handles errors gracefully."""
     from src.system_tray import SystemTray
@@ -288,7 +278,7 @@ def test_menu_action_backup_now_failure(
 
 
 def test_menu_action_restore_from_backup(
-    qapp, mock_overlay_window, mock_snippet_manager, mock_config_manager
+    qt_app, mock_overlay_window, mock_snippet_manager, mock_config_manager
 ):
     """Test that 'Restore from Backup' opens restore dialog."""
     from src.system_tray import SystemTray
@@ -322,7 +312,7 @@ def test_menu_action_restore_from_backup(
 
 
 def test_menu_action_restore_from_backup_no_backups(
-    qapp, mock_overlay_window, mock_snippet_manager, mock_config_manager
+    qt_app, mock_overlay_window, mock_snippet_manager, mock_config_manager
 ):
     """Test that 'Restore from Backup' shows error when no backups available."""
     from src.system_tray import SystemTray
@@ -343,7 +333,7 @@ def test_menu_action_restore_from_backup_no_backups(
 
 
 def test_menu_action_open_backup_folder(
-    qapp, mock_overlay_window, mock_snippet_manager, mock_config_manager
+    qt_app, mock_overlay_window, mock_snippet_manager, mock_config_manager
 ):
     """Test that 'Open Backup Folder' opens folder in Explorer."""
     from src.system_tray import SystemTray
@@ -119,6 +119,16 @@ class TestUsageTrackerIncrement:
         assert tracker.get_count("snippet-1") == 2
         assert tracker.get_count("snippet-2") == 1
 
+    def test_increment_many(self, tmp_path):
+        """increment_many should count every ID, including repeats."""
+        stats_file = tmp_path / "usage_stats.yaml"
+        tracker = UsageTracker(str(stats_file))
+
+        tracker.increment_many(["snippet-1", "snippet-2", "snippet-1"])
+
+        assert tracker.get_count("snippet-1") == 2
+        assert tracker.get_count("snippet-2") == 1
+
 
 class TestUsageTrackerPersistence:
     """Test save and load functionality."""
@@ -181,6 +191,129 @@ class TestUsageTrackerPersistence:
         assert stats_file.parent.exists()
         assert stats_file.exists()
 
+    def test_save_skips_write_when_unchanged(self, tmp_path):
+        """Save should not write the file when nothing has changed."""
+        stats_file = tmp_path / "usage_stats.yaml"
+        tracker = UsageTracker(str(stats_file))
+
+        tracker.save()
+        assert not stats_file.exists()
+
+        tracker.increment("snippet-1")
+        tracker.save()
+        stats_file.unlink()
+
+        tracker.save()
+        assert not stats_file.exists()
+
+    def test_debounced_save_coalesces_increments(self, tmp_path):
+        """With save_debounce_s, increments are written once after the delay."""
+        import time
+
+        stats_file = tmp_path / "usage_stats.yaml"
+        tracker = UsageTracker(str(stats_file), save_debounce_s=0.1)
+
+        tracker.increment("snippet-1")
+        tracker.increment("snippet-1")
+        assert not stats_file.exists()
+
+        time.sleep(0.4)
+
+        assert UsageTracker(str(stats_file)).get_count("snippet-1") == 2
+
+    def test_flush_writes_pending_changes(self, tmp_path):
+        """flush should write immediately and cancel the pending save."""
+        stats_file = tmp_path / "usage_stats.yaml"
+        tracker = UsageTracker(str(stats_file), save_debounce_s=60)
+
+        tracker.increment("snippet-1")
+        tracker.flush()
+
+        assert UsageTracker(str(stats_file)).get_count("snippet-1") == 1
+
+    def test_increment_during_save_is_not_lost(self, tmp_path):
+        """An increment made while a save is writing should be saved later."""
+        import os
+        from unittest.mock import patch
+
+        stats_file = tmp_path / "usage_stats.yaml"
+        tracker = UsageTracker(str(stats_file))
+        tracker.increment("snippet-1")
+
+        real_fsync = os.fsync
+
+        def fsync_with_increment(fd):
+            tracker.increment("snippet-1")
+            return real_fsync(fd)
+
+        with patch("src.usage_tracker.os.fsync", side_effect=fsync_with_increment):
+            tracker.save()
+        tracker.flush()
+
+        assert tracker.get_count("snippet-1") == 2
+        assert UsageTracker(str(stats_file)).get_count("snippet-1") == 2
+
+    def test_failed_save_keeps_tracker_dirty(self, tmp_path):
+        """A failed save should leave the changes pending for the next save."""
+        from unittest.mock import patch
+
+        stats_file = tmp_path / "usage_stats.yaml"
+        tracker = UsageTracker(str(stats_file))
+        tracker.increment("snippet-1")
+
+        with patch("src.usage_tracker.os.replace", side_effect=OSError("disk full")):
+            tracker.save()
+        tracker.save()
+
+        assert UsageTracker(str(stats_file)).get_count("snippet-1") == 1
+
+    def test_json_stats_file_round_trip(self, tmp_path):
+        """A .json stats file should be written as JSON and reload correctly."""
+        import json
+
+        stats_file = tmp_path / "usage_stats.json"
+        tracker = UsageTracker(str(stats_file))
+
+        tracker.increment("snippet-1")
+        tracker.increment("snippet-1")
+        tracker.save()
+
+        data = json.loads(stats_file.read_text())
+        assert data == {"snippet_usage": {"snippet-1": 2}}
+        assert UsageTracker(str(stats_file)).get_count("snippet-1") == 2
+
+    def test_json_stats_file_migrates_from_yaml(self, tmp_path):
+        """A missing .json stats file should be migrated from the .yaml one."""
+        legacy_file = tmp_path / "usage_stats.yaml"
+        with open(legacy_file, "w") as f:
+            yaml.dump({"snippet_usage": {"snippet-1": 7}}, f)
+
+        stats_file = tmp_path / "usage_stats.json"
+        tracker = UsageTracker(str(stats_file))
+        assert tracker.get_count("snippet-1") == 7
+
+        tracker.save()
+
+        assert stats_file.exists()
+        assert UsageTracker(str(stats_file)).get_count("snippet-1") == 7
+
+    def test_failed_save_keeps_previous_file(self, tmp_path):
+        """A failed save should leave the previous stats file untouched."""
+        from unittest.mock import patch
+
+        stats_file = tmp_path / "usage_stats.yaml"
+        tracker = UsageTracker(str(stats_file))
+        tracker.increment("snippet-1")
+        tracker.save()
+        original = stats_file.read_text()
+
+        tracker.increment("snippet-1")
+        with patch("src.usage_tracker.os.replace", side_effect=OSError("disk full")):
+            tracker.save()
+
+        assert stats_file.read_text() == original
+        assert list(tmp_path.iterdir()) == [stats_file]
+
 
 class TestUsageTrackerCleanup:
     """Test cleanup of orphaned usage stats."""
@@ -254,6 +387,21 @@ class TestUsageTrackerCleanup:
         assert tracker.get_count("snippet-1") == 0
         assert tracker.get_count("snippet-2") == 0
 
+    def test_cleanup_schedules_debounced_save(self, tmp_path):
+        """With save_debounce_s, cleanup should be written after the delay."""
+        import time
+
+        stats_file = tmp_path / "usage_stats.yaml"
+        with open(stats_file, "w") as f:
+            yaml.dump({"snippet_usage": {"snippet-1": 10, "snippet-2": 20}}, f)
+
+        tracker = UsageTracker(str(stats_file), save_debounce_s=0.1)
+        tracker.cleanup_orphaned(["snippet-1"])
+
+        time.sleep(0.4)
+
+        assert UsageTracker(str(stats_file)).get_all_counts() == {"snippet-1": 10}
+
 
 class TestUsageTrackerGetCount:
     """Test get_count functionality."""
@@ -31,8 +31,8 @@ def test_simple_variable():
     result = detect_variables(content)
 
     assert len(result) == 1
-    assert result[0]["name"] == "filepath"
-    assert result[0]["default"] is None
+    assert result[0].name == "filepath"
+    assert result[0].default is None
 
 
 def test_variable_with_default():
@@ -41,8 +41,8 @@ def test_variable_with_default():
     result = detect_variables(content)
 
     assert len(result) == 1
-    assert result[0]["name"] == "app_name"
-    assert result[0]["default"] == "app"
+    assert result[0].name == "app_name"
+    assert result[0].default == "app"
 
 
 def test_multiple_variables():
@@ -53,11 +53,11 @@ def test_multiple_variables():
     assert len(result) == 2
 
     # Variables should be in order of first appearance
-    assert result[0]["name"] == "app_name"
-    assert result[0]["default"] == "app"
+    assert result[0].name == "app_name"
+    assert result[0].default == "app"
 
-    assert result[1]["name"] == "port"
-    assert result[1]["default"] == "5000"
+    assert result[1].name == "port"
+    assert result[1].default == "5000"
 
 
 def test_duplicate_variable():
@@ -68,7 +68,7 @@ def test_duplicate_variable():
     # Should return only unique variables
     assert len(result) == 2
 
-    var_names = [v["name"] for v in result]
+    var_names = [v.name for v in result]
     assert "repo" in var_names
     assert "clone_dir" in var_names
 
@@ -82,34 +82,34 @@ def test_flexible_variable_names():
     content1 = "Test {{app-name}} valid"
     result1 = detect_variables(content1)
     assert len(result1) == 1
-    assert result1[0]["name"] == "app-name"
+    assert result1[0].name == "app-name"
 
     # Variables with spaces should work
     content2 = "Test {{app name}} valid"
     result2 = detect_variables(content2)
     assert len(result2) == 1
-    assert result2[0]["name"] == "app name"
+    assert result2[0].name == "app name"
 
     # Valid variable with underscore should work
     content3 = "Test {{app_name}} valid"
     result3 = detect_variables(content3)
     assert len(result3) == 1
-    assert result3[0]["name"] == "app_name"
+    assert result3[0].name == "app_name"
 
     # Mix of different naming styles - all should work
     content4 = "{{valid_var}} and {{hyphen-var}} and {{space var}}"
     result4 = detect_variables(content4)
     assert len(result4) == 3
-    assert result4[0]["name"] == "valid_var"
-    assert result4[1]["name"] == "hyphen-var"
-    assert result4[2]["name"] == "space var"
+    assert result4[0].name == "valid_var"
+    assert result4[1].name == "hyphen-var"
+    assert result4[2].name == "space var"
 
     # Real-world example with descriptive names
     content5 = "Branch: {{short-description}} for {{Describe the bug}}"
     result5 = detect_variables(content5)
     assert len(result5) == 2
-    assert result5[0]["name"] == "short-description"
-    assert result5[1]["name"] == "Describe the bug"
+    assert result5[0].name == "short-description"
+    assert result5[1].name == "Describe the bug"
 
 
 def test_nested_braces_literal():
@@ -121,7 +121,7 @@ def test_nested_braces_literal():
     # Should detect the inner {{var}} as a valid variable
     # The outer single braces are literal
     assert len(result) == 1
-    assert result[0]["name"] == "var"
+    assert result[0].name == "var"
 
 
 def test_empty_variable_name():
@@ -134,8 +134,18 @@ def test_empty_variable_name():
     content2 = "{{valid}} and {{}} and {{another}}"
     result2 = detect_variables(content2)
     assert len(result2) == 2
-    assert result2[0]["name"] == "valid"
-    assert result2[1]["name"] == "another"
+    assert result2[0].name == "valid"
+    assert result2[1].name == "another"
+
+
+def test_detect_variables_returns_fresh_list():
+    """Test that mutating a cached detection result does not leak into later calls."""
+    content = "ssh {{user}}@{{host:localhost}}"
+    first = detect_variables(content)
+    first.clear()
+
+    second = detect_variables(content)
+    assert [v.name for v in second] == ["user", "host"]
 
 
 # ==============================
@@ -197,3 +207,57 @@ def test_substitute_multiple_occurrences():
     assert "example.com" in result2
     assert result2.count("example.com") == 2
     assert result2.count("8080") == 2
+
+
+def test_substituted_values_are_not_rescanned():
+    """Test that a value containing {{...}} is inserted literally."""
+    content = "{{first}} then {{second}}"
+    values = {"first": "{{second}}", "second": "done"}
+    result = substitute_variables(content, values)
+    assert result == "{{second}} then done"
+
+
+def test_substitute_trims_whitespace_in_names():
+    """Test that padded placeholders are substituted like detection trims them."""
+    content = "Run {{ cmd }} then {{cmd}}"
+    assert detect_variables(content)[0].name == "cmd"
+    result = substitute_variables(content, {"cmd": "make"})
+    assert result == "Run make then make"
+
+
+def test_substitute_plain_and_braced_content():
+    """Test that plain placeholders and literal braces both substitute correctly."""
+    # Plain identifiers only
+    assert (
+        substitute_variables("cd {{dir}} && ls {{dir}}", {"dir": "/tmp"})
+        == "cd /tmp && ls /tmp"
+    )
+
+    # Literal braces and empty defaults must not be treated as format fields
+    content = "function() { return {{value}}; } {{opt:}}"
+    assert (
+        substitute_variables(content, {"value": "{x}"}) == "function() { return {x}; } "
+    )
+
+
+def test_compiled_template_renders_repeatedly():
+    """Test a compiled template can be rendered with different values."""
+    from src.variable_handler import compile_template
+
+    src = "git checkout {{branch}} {{ }} {{remote:origin}}"
+    template = compile_template(src)
+    assert compile_template(src) is template
+
+    assert template.render({"branch": "main"}) == "git checkout main {{ }} origin"
+    assert (
+        template.render({"branch": "dev", "remote": "up"})
+        == "git checkout dev {{ }} up"
+    )
+    with pytest.raises(ValueError, match="'branch'"):
+        template.render({})
+
+
+def test_substitute_without_variables_returns_input():
+    """Test content with nothing to substitute is returned as the same object."""
+    for content in ("plain text", "empty {{ }} placeholder"):
+        assert substitute_variables(content, {}) is content
@@ -7,31 +7,13 @@ Test Coverage:
 3. OK button returns user value
 4. Cancel button aborts operation
 5. Empty input validation
-6. Sequential prompts for multiple variables
-7. Cancel during sequential prompts aborts entire operation
+6. Single form dialog for multiple variables
+7. Cancel aborts entire operation
 """
 
-import pytest
-import sys
 from unittest.mock import Mock, patch
 
 
-@pytest.fixture(scope="module")
-def qt_app():
-    """Create QApplication instance for testing."""
-    from PySide6.QtWidgets import QApplication
-    from PySide6.QtCore import QCoreApplication
-
-    # Check if an instance already exists using QCoreApplication
-    existing_app = QCoreApplication.instance()
-    if existing_app is not None:
-        yield existing_app
-    else:
-        # Create new QApplication
-        app_instance = QApplication(sys.argv if sys.argv else [])
-        yield app_instance
-
-
 def test_dialog_shows_variable_name(qt_app):
     """Test dialog displays correct variable name in label."""
     from src.variable_prompt_dialog import VariablePromptDialog
@@ -101,56 +83,107 @@ def test_dialog_empty_input_shows_error(qt_app):
         assert "required" in mock_warning.call_args[0][2].lower()
 
 
-def test_sequential_prompts_for_multiple_variables(qt_app):
-    """Test multiple variables prompt sequentially."""
+def test_form_dialog_shows_row_per_variable(qt_app):
+    """Test form dialog has one pre-populated input per variable."""
+    from src.variable_prompt_dialog import MultiVariablePromptDialog
+    from src.variable_handler import Variable
+
+    dialog = MultiVariablePromptDialog(
+        [Variable("var1", None), Variable("var2", "default2")]
+    )
+
+    assert list(dialog.input_fields) == ["var1", "var2"]
+    assert dialog.input_fields["var1"].text() == ""
+    assert dialog.input_fields["var2"].text() == "default2"
+
+
+def test_form_dialog_empty_field_shows_error(qt_app):
+    """Test OK with any empty field shows error and does not accept."""
+    from src.variable_prompt_dialog import MultiVariablePromptDialog
+    from src.variable_handler import Variable
+    from PySide6.QtWidgets import QMessageBox
+
+    dialog = MultiVariablePromptDialog([Variable("var1"), Variable("var2")])
+    dialog.input_fields["var1"].setText("value1")
+
+    with patch.object(QMessageBox, "warning") as mock_warning:
+        dialog._on_ok()
+
+        mock_warning.assert_called_once()
+        assert "var2" in mock_warning.call_args[0][2]
+        assert dialog.values is None
+
+    dialog.input_fields["var2"].setText("value2")
+    dialog._on_ok()
+    assert dialog.values == {"var1": "value1", "var2": "value2"}
+
+
+def test_form_dialog_reused_per_parent(qt_app):
+    """Test repeated prompts with the same parent reuse one reconfigured dialog."""
+    from src.variable_prompt_dialog import (
+        MultiVariablePromptDialog,
+        _dialog_pool,
+        prompt_for_variables,
+    )
+    from src.variable_handler import Variable
+    from PySide6.QtWidgets import QDialog, QWidget
+
+    parent = QWidget()
+    with patch.object(
+        MultiVariablePromptDialog, "exec", return_value=QDialog.DialogCode.Rejected
+    ):
+        prompt_for_variables([Variable("a"), Variable("b"), Variable("c")], parent)
+        dialog = _dialog_pool[parent]
+
+        prompt_for_variables([Variable("port", "8080")], parent)
+
+    assert _dialog_pool[parent] is dialog
+    assert list(dialog.input_fields) == ["port"]
+    assert dialog.input_fields["port"].text() == "8080"
+    assert dialog.form_layout.rowCount() == 1
+
+
+def test_prompts_for_multiple_variables_in_one_dialog(qt_app):
+    """Test multiple variables are collected from a single dialog."""
     from src.variable_prompt_dialog import prompt_for_variables
-    from unittest.mock import patch, MagicMock
+    from src.variable_handler import Variable
+    from unittest.mock import patch
 
     variables = [
-        {"name": "var1", "default": None},
-        {"name": "var2", "default": "default2"},
+        Variable("var1", None),
+        Variable("var2", "default2"),
     ]
 
     # Mock the dialog to return values without showing UI
-    with patch("src.variable_prompt_dialog.VariablePromptDialog") as MockDialog:
-        mock_dialog1 = MagicMock()
-        mock_dialog1.get_value.return_value = "value1"
-
-        mock_dialog2 = MagicMock()
-        mock_dialog2.get_value.return_value = "value2"
-
-        MockDialog.side_effect = [mock_dialog1, mock_dialog2]
+    with patch("src.variable_prompt_dialog.MultiVariablePromptDialog") as MockDialog:
+        MockDialog.return_value.get_values.return_value = {
+            "var1": "value1",
+            "var2": "value2",
+        }
 
         result = prompt_for_variables(variables)
 
         assert result == {"var1": "value1", "var2": "value2"}
-        assert MockDialog.call_count == 2
+        assert MockDialog.call_count == 1
+        MockDialog.assert_called_once_with(variables, None)
 
 
-def test_cancel_during_sequential_prompts_aborts(qt_app):
-    """Test Cancel mid-sequence aborts entire operation."""
+def test_cancel_prompt_aborts(qt_app):
+    """Test Cancel aborts entire operation."""
     from src.variable_prompt_dialog import prompt_for_variables
-    from unittest.mock import patch, MagicMock
+    from src.variable_handler import Variable
+    from unittest.mock import patch
 
     variables = [
-        {"name": "var1", "default": None},
-        {"name": "var2", "default": None},
-        {"name": "var3", "default": None},
+        Variable("var1", None),
+        Variable("var2", None),
+        Variable("var3", None),
     ]
 
-    # Mock the dialog: first returns value, second returns None (cancel), third never called
-    with patch("src.variable_prompt_dialog.VariablePromptDialog") as MockDialog:
-        mock_dialog1 = MagicMock()
-        mock_dialog1.get_value.return_value = "value1"
-
-        mock_dialog2 = MagicMock()
-        mock_dialog2.get_value.return_value = None  # User cancelled
-
-        MockDialog.side_effect = [mock_dialog1, mock_dialog2]
+    with patch("src.variable_prompt_dialog.MultiVariablePromptDialog") as MockDialog:
+        MockDialog.return_value.get_values.return_value = None  # User cancelled
 
         result = prompt_for_variables(variables)
 
         # Operation should abort and return None
         assert result is None
-        # Only 2 dialogs should have been created (3rd never shown)
-        assert MockDialog.call_count == 2